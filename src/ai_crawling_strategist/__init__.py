@@ -1,44 +1,55 @@
 """AI Crawling Strategist - DOM parsing with rolling memory."""
 
-from .config import global_config
+import sys
+import types
+
+from .config import GlobalConfig, global_config
 from .auth import CredentialResolver, AWSCredentials
 from .exceptions import ConfigurationError
-from .core import DOMStrategist
+from .core import DOMStrategist, get_strategist
+
+# Configuration keys mirrored between the module and global_config,
+# derived from GlobalConfig so new settings are picked up automatically
+_CFG_KEYS = frozenset(
+    key for key in GlobalConfig.__annotations__ if not key.startswith('_')
+)
+
+
+class _ConfigModule(types.ModuleType):
+    """Module subclass that syncs configuration attributes with global_config.
+
+    Module objects ignore per-instance __setattr__ patches, so assignment
+    interception has to live on the module's class. Reads go straight to
+    the module __dict__ with no dispatch overhead.
+
+    Usage: import ai_crawling_strategist as acs; acs.aws_access_key_id = "..."
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if name in _CFG_KEYS:
+            setattr(global_config, name, value)
+        super().__setattr__(name, value)
 
-# Module-level attribute access for global configuration
-# Usage: import ai_crawling_strategist as acs; acs.aws_access_key_id = "..."
-def __getattr__(name):
-    """Handle dynamic attribute access for global configuration."""
-    if hasattr(global_config, name):
-        return getattr(global_config, name)
-    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-# Initialize module attributes to support direct assignment
-import sys
 _this_module = sys.modules[__name__]
+_this_module.__class__ = _ConfigModule
+
+# Initialize module attributes to support direct assignment
 _this_module.aws_access_key_id = None
 _this_module.aws_secret_access_key = None
 _this_module.aws_region = None
 
-# Monkey patch module to sync with global_config
-_original_setattr = _this_module.__setattr__
-
-def _patched_setattr(name, value):
-    """Sync module attributes with global config."""
-    if hasattr(global_config, name):
-        setattr(global_config, name, value)
-    _original_setattr(name, value)
-
-_this_module.__setattr__ = _patched_setattr
-
 __all__ = [
     # Main API
     "DOMStrategist",
-    
+    "get_strategist",
+
     # Authentication components
-    "CredentialResolver", 
+    "CredentialResolver",
     "AWSCredentials",
-    
+
     # Exception classes
     "ConfigurationError"
 ]
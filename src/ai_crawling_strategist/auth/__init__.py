@@ -1,11 +1,26 @@
 """Authentication module for AWS credential management."""
 
+import functools
+
 from .credentials import CredentialResolver, AWSCredentials, ConfigurationValidator
 from .profile_manager import ProfileManager
 
+
+@functools.lru_cache(maxsize=1)
+def get_resolver() -> CredentialResolver:
+    """Return the process-wide CredentialResolver instance.
+
+    Sharing one resolver lets every caller benefit from its resolve()
+    memoization and the cached bedrock client instead of paying
+    construction cost per DOMStrategist.
+    """
+    return CredentialResolver()
+
+
 __all__ = [
     "CredentialResolver",
-    "AWSCredentials", 
+    "AWSCredentials",
     "ConfigurationValidator",
-    "ProfileManager"
+    "ProfileManager",
+    "get_resolver"
 ]
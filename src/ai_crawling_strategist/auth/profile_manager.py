@@ -13,6 +13,8 @@ class ProfileManager:
     
     def __init__(self):
         self.credentials_path = Path.home() / ".aws" / "credentials"
+        self._cache = None
+        self._cache_mtime = None
     
     def get_profile_credentials(self, profile_name: str) -> Dict[str, str]:
         """Load credentials from ~/.aws/credentials."""
@@ -45,7 +47,9 @@ class ProfileManager:
     
     def validate_profile_exists(self, profile_name: str) -> bool:
         """Check if specified profile exists."""
-        return profile_name in self.list_available_profiles()
+        if not self.credentials_path.exists():
+            return False
+        return self._load_credentials_file().has_section(profile_name)
     
     def get_default_profile(self) -> Optional[Dict[str, str]]:
         """Load default profile if available."""
@@ -55,10 +59,19 @@ class ProfileManager:
             return None
     
     def _load_credentials_file(self) -> configparser.ConfigParser:
-        """Load and parse AWS credentials file."""
+        """Load and parse AWS credentials file, caching by file mtime."""
         if not self.credentials_path.exists():
             raise InvalidProfileError("AWS credentials file not found at ~/.aws/credentials")
-        
-        config = configparser.ConfigParser()
-        config.read(self.credentials_path)
+
+        mtime = self.credentials_path.stat().st_mtime_ns
+        if self._cache is not None and self._cache_mtime == mtime:
+            return self._cache
+
+        # read_text + read_string skips ConfigParser's per-path open/encoding
+        # handling; interpolation is never used in AWS credential files
+        text = self.credentials_path.read_text(encoding='utf-8')
+        config = configparser.ConfigParser(interpolation=None)
+        config.read_string(text)
+        self._cache = config
+        self._cache_mtime = mtime
         return config
@@ -6,13 +6,14 @@ with rolling memory. It orchestrates the complete pipeline from HTML preprocessi
 through LLM-powered analysis to final extraction schema generation.
 """
 
-from .strategist import DOMStrategist
+from .strategist import DOMStrategist, get_strategist
 from .chunker import DOMChunker
 from .memory_manager import MemoryManager
 from .schema_generator import SchemaGenerator
 
 __all__ = [
     "DOMStrategist",
+    "get_strategist",
     "DOMChunker", 
     "MemoryManager",
     "SchemaGenerator"
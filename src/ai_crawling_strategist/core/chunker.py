@@ -2,12 +2,24 @@
 
 from typing import List, Optional
 import re
-from bs4 import BeautifulSoup, NavigableString
+from bs4 import BeautifulSoup, Comment, Doctype, NavigableString
 
 from ..models.chunks import DOMChunk, ChunkContext, ChunkBoundary
 from ..exceptions import ConfigurationError, ProcessingError, ChunkingError
 
 
+# Prefer the C-backed lxml parser for chunking; fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    _PARSER = 'lxml'
+except ImportError:
+    _PARSER = 'html.parser'
+
+
+# Precompiled once; _estimate_tokens runs per element in the chunking loop
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
 class DOMChunker:
     """
     Splits large DOM trees into manageable chunks while preserving structure.
@@ -36,99 +48,144 @@ class DOMChunker:
         self.overlap_tokens = overlap_tokens
     
     def chunk_dom(
-        self, 
-        cleaned_html: str, 
+        self,
+        cleaned_html: str,
         preserve_context: bool = True
     ) -> List[DOMChunk]:
         """
         Split DOM into chunks with context preservation.
-        
+
+        Args:
+            cleaned_html: Preprocessed HTML from html_cleaner
+            preserve_context: Whether to track parent element stack
+
+        Returns:
+            List[DOMChunk]: Ordered chunks with accurate total_chunks counts
+        """
+        chunks = list(self.iter_chunks(cleaned_html, preserve_context=preserve_context))
+
+        # Update total_chunks in all chunks
+        actual_total = len(chunks)
+        for chunk in chunks:
+            chunk.total_chunks = actual_total
+
+        return chunks
+
+    def iter_chunks(
+        self,
+        cleaned_html: str,
+        preserve_context: bool = True
+    ):
+        """
+        Lazily split DOM into chunks with context preservation.
+
         Algorithm:
         1. Parse HTML into BeautifulSoup tree
         2. Traverse DOM depth-first
         3. Accumulate elements until chunk_size reached
         4. Find next complete tag closure
         5. Record parent context stack
-        6. Create chunk with position information
-        
+        6. Yield chunk with position information
+
+        Chunks are yielded as they are assembled, so downstream consumers
+        can start processing chunk 0 before the rest of the document has
+        been walked and only one chunk's content stays buffered. Yielded
+        chunks carry a provisional total_chunks (the count so far, since
+        the model requires at least one); chunk_dom() patches in the final
+        count after materializing the list.
+
         Args:
             cleaned_html: Preprocessed HTML from html_cleaner
             preserve_context: Whether to track parent element stack
-            
-        Returns:
-            List[DOMChunk]: Ordered chunks with context information
+
+        Yields:
+            DOMChunk: Ordered chunks with context information
         """
         try:
-            soup = BeautifulSoup(cleaned_html, 'html.parser')
+            soup = BeautifulSoup(cleaned_html, _PARSER)
         except Exception as e:
             raise ChunkingError(f"Failed to parse HTML: {e}")
-        
-        chunks = []
-        current_html = ""
+
+        current_parts = []
+        current_tokens = 0
         current_position = 0
         chunk_index = 0
         context_stack = []
-        
-        # Calculate total estimated chunks for metadata
-        total_estimated_tokens = self._estimate_tokens(cleaned_html)
-        total_chunks = max(1, (total_estimated_tokens + self.chunk_size - 1) // self.chunk_size)
-        
-        for element in soup.descendants:
+
+        # Walk top-level nodes, treating each element as an atomic unit unless
+        # it alone exceeds the chunk size, in which case we descend into its
+        # children. This avoids re-serializing every subtree once per nesting
+        # level, which the old soup.descendants walk did.
+        pending = list(soup.contents)
+        pending.reverse()
+        while pending:
+            element = pending.pop()
             if isinstance(element, NavigableString):
-                # Add text content
-                text = str(element).strip()
-                if text:
-                    current_html += text
-            else:
-                # Handle tag elements
-                element_html = str(element)
-                
-                # Check if adding this element would exceed chunk size
-                test_html = current_html + element_html
-                if self._estimate_tokens(test_html) > self.chunk_size and current_html:
-                    # Create chunk with current content
-                    chunk = self._create_chunk(
-                        chunk_id=f"chunk_{chunk_index}",
-                        html_content=current_html,
-                        chunk_index=chunk_index,
-                        total_chunks=total_chunks,
-                        start_position=current_position,
-                        context_stack=context_stack if preserve_context else [],
-                        cleaned_html=cleaned_html
-                    )
-                    chunks.append(chunk)
-                    
-                    # Setup for next chunk with overlap
-                    current_position += len(current_html)
-                    current_html = self._create_overlap_content(current_html, element_html)
-                    chunk_index += 1
-                else:
-                    current_html += element_html
-                
-                # Update context stack
+                # Comments and doctypes carry no extractable content
+                if isinstance(element, (Comment, Doctype)):
+                    continue
+                # NavigableString is a str subclass; check isspace() first to
+                # avoid allocating a stripped copy of whitespace-only nodes
+                if not element or element.isspace():
+                    continue
+                text = element.strip()
+                current_parts.append(text)
+                current_tokens += self._estimate_tokens(text)
+                continue
+
+            # Handle tag elements. Size is estimated from text content only
+            # (matching _estimate_tokens, which strips tags), so elements we
+            # end up opening and walking are never serialized at all.
+            element_tokens = len(element.get_text()) // 4
+
+            if element_tokens > self.chunk_size:
+                # Element too large to keep atomic: open it and walk children
                 if preserve_context:
                     self._update_context_stack(context_stack, element)
-        
+                pending.extend(reversed(element.contents))
+                continue
+
+            element_html = str(element)
+
+            # Check if adding this element would exceed chunk size
+            if current_tokens + element_tokens > self.chunk_size and current_parts:
+                # Create chunk with current content
+                current_html = "".join(current_parts)
+                chunk = self._create_chunk(
+                    chunk_id=f"chunk_{chunk_index}",
+                    html_content=current_html,
+                    chunk_index=chunk_index,
+                    total_chunks=chunk_index + 1,  # Placeholder, patched below
+                    start_position=current_position,
+                    context_stack=context_stack if preserve_context else [],
+                    cleaned_html=cleaned_html
+                )
+                yield chunk
+
+                # Setup for next chunk with overlap
+                current_position += len(current_html)
+                overlap_html = self._create_overlap_content(current_html, element_html)
+                current_parts = [overlap_html]
+                current_tokens = self._estimate_tokens(overlap_html)
+                chunk_index += 1
+            else:
+                current_parts.append(element_html)
+                current_tokens += element_tokens
+
         # Create final chunk if there's remaining content
+        current_html = "".join(current_parts)
         if current_html.strip():
             chunk = self._create_chunk(
                 chunk_id=f"chunk_{chunk_index}",
                 html_content=current_html,
                 chunk_index=chunk_index,
-                total_chunks=max(total_chunks, chunk_index + 1),
+                total_chunks=chunk_index + 1,  # Placeholder, patched below
                 start_position=current_position,
                 context_stack=context_stack if preserve_context else [],
                 cleaned_html=cleaned_html
             )
-            chunks.append(chunk)
-        
-        # Update total_chunks in all chunks
-        actual_total = len(chunks)
-        for chunk in chunks:
-            chunk.total_chunks = actual_total
-        
-        return chunks
-    
+            yield chunk
+
     def _create_chunk(
         self,
         chunk_id: str,
@@ -148,8 +205,9 @@ class DOMChunker:
         # Extract context information
         context = self._extract_parent_context(context_stack)
         
-        # Create boundary information
-        boundary = ChunkBoundary(
+        # Create boundary information; positions are derived above, so
+        # trusted construction skips pydantic validation on the hot path
+        boundary = ChunkBoundary.model_construct(
             start_position=start_position,
             end_position=end_position,
             start_tag_complete=True,  # We ensure this in _ensure_valid_html
@@ -157,7 +215,7 @@ class DOMChunker:
             boundary_type="tag_boundary"
         )
         
-        return DOMChunk(
+        return DOMChunk.construct_trusted(
             chunk_id=chunk_id,
             html_content=cleaned_content,
             context=context,
@@ -173,7 +231,9 @@ class DOMChunker:
     
     def _extract_parent_context(self, context_stack: List[str]) -> ChunkContext:
         """Build parent tag stack for context preservation."""
-        context = ChunkContext()
+        # Internal emit path: start from a trusted empty context and let
+        # add_parent_tag maintain the stack and its indexes
+        context = ChunkContext.model_construct()
         
         for tag_info in context_stack:
             # Simple tag name extraction for now
@@ -219,7 +279,11 @@ class DOMChunker:
         return overlap_content + next_element_html
     
     def _find_safe_cutpoint(self, html_fragment: str, position: int, forward: bool = True) -> int:
-        """Find next complete tag closure for clean chunk boundaries."""
+        """Find next complete tag closure for clean chunk boundaries.
+
+        Each fragment is queried exactly once per chunk, so a single
+        C-level find/rfind beats building any per-fragment index.
+        """
         if forward:
             # Find next opening tag
             next_tag = html_fragment.find('<', position)
@@ -229,8 +293,16 @@ class DOMChunker:
             prev_tag_end = html_fragment.rfind('>', 0, position)
             return prev_tag_end + 1 if prev_tag_end != -1 else 0
     
-    def _ensure_valid_html(self, html_content: str) -> str:
-        """Ensure HTML chunk has valid structure."""
+    def _ensure_valid_html(self, html_content: str, validate: bool = False) -> str:
+        """Ensure HTML chunk has valid structure.
+
+        Chunks are assembled from str(element) of already-parsed nodes, so
+        they are well-formed by construction; the parse/reserialize
+        round-trip is only kept as an opt-in debug path.
+        """
+        if not validate:
+            return html_content
+
         try:
             # Parse and reserialize to fix any malformed HTML
             soup = BeautifulSoup(html_content, 'html.parser')
@@ -241,7 +313,11 @@ class DOMChunker:
     
     def _estimate_tokens(self, html_content: str) -> int:
         """Rough token estimation for chunk sizing."""
-        # Remove HTML tags for better estimation
-        text_content = re.sub(r'<[^>]+>', '', html_content)
+        # Fast path: plain text fragments need no tag stripping
+        if '<' not in html_content:
+            return len(html_content) // 4
+        # Count non-tag characters by subtracting tag spans; keeps the scan
+        # in C without allocating a stripped copy of the content
+        tag_chars = sum(m.end() - m.start() for m in _TAG_RE.finditer(html_content))
         # Rough estimation: ~4 characters per token
-        return len(text_content) // 4
+        return (len(html_content) - tag_chars) // 4
@@ -1,21 +1,112 @@
 """Rolling memory evolution for tracking extraction patterns across DOM chunks."""
 
 from typing import Dict, List, Optional
+import hashlib
 import logging
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from ..models.memory import (
     ChunkMemoryInput, ChunkMemoryOutput, DiscoveredFacts, 
     UserIntent, DOMPosition, MemoryCompressionStrategy
 )
 from ..models.chunks import DOMChunk
-from ..llm import ClaudeClient, render_chunk_analysis_prompt, validate_json_response
+from ..llm import (
+    ClaudeClient, render_chunk_analysis_prompt,
+    render_chunk_analysis_batch_prompt, validate_json_response
+)
+from ..preprocessing import compile_selector, compile_xpath, parse_html_cached
 from ..exceptions import ConfigurationError, MemoryError
 
 
 logger = logging.getLogger(__name__)
 
 
+# Prefer the C-backed lxml parser for pattern validation
+try:
+    import lxml  # noqa: F401
+    _PARSER = 'lxml'
+except ImportError:
+    _PARSER = 'html.parser'
+
+
+# Common extraction targets keyed by entity name
+_ENTITY_KEYWORDS = {
+    "title": ["title", "name", "heading"],
+    "price": ["price", "cost", "amount", "salary"],
+    "description": ["description", "summary", "details"],
+    "link": ["link", "url", "href"],
+    "image": ["image", "photo", "picture"],
+    "date": ["date", "time", "when"],
+    "author": ["author", "by", "creator"],
+    "category": ["category", "type", "genre"],
+    "rating": ["rating", "score", "stars"],
+    "location": ["location", "address", "where"]
+}
+
+# Domain contexts keyed by context label
+_CONTEXT_PATTERNS = {
+    "job listings": ["job", "position", "career", "employment"],
+    "products": ["product", "item", "buy", "shop", "store"],
+    "articles": ["article", "blog", "news", "post"],
+    "events": ["event", "meeting", "conference", "show"],
+    "people": ["people", "person", "profile", "contact"]
+}
+
+# Aho-Corasick automaton over all keywords, built once on first use; a
+# single C-level pass replaces ~60 Python substring checks per query
+_keyword_automaton = None
+_keyword_automaton_failed = False
+
+
+def _get_keyword_automaton():
+    """Build (once) and return the keyword automaton, or None if unavailable."""
+    global _keyword_automaton, _keyword_automaton_failed
+    if _keyword_automaton is None and not _keyword_automaton_failed:
+        try:
+            import ahocorasick
+        except ImportError:
+            _keyword_automaton_failed = True
+            return None
+
+        labels_by_word = {}
+        for entity, keywords in _ENTITY_KEYWORDS.items():
+            for keyword in keywords:
+                labels_by_word.setdefault(keyword, []).append(("entity", entity))
+        for context, keywords in _CONTEXT_PATTERNS.items():
+            for keyword in keywords:
+                labels_by_word.setdefault(keyword, []).append(("context", context))
+
+        automaton = ahocorasick.Automaton()
+        for word, labels in labels_by_word.items():
+            automaton.add_word(word, labels)
+        automaton.make_automaton()
+        _keyword_automaton = automaton
+
+    return _keyword_automaton
+
+
+def _scan_keywords(query_lower: str) -> set:
+    """Return the set of (kind, label) keyword hits for a lowercased query."""
+    automaton = _get_keyword_automaton()
+    if automaton is not None:
+        return {
+            label
+            for _, labels in automaton.iter(query_lower)
+            for label in labels
+        }
+
+    # Fallback: nested substring scans over the keyword tables
+    hits = set()
+    for entity, keywords in _ENTITY_KEYWORDS.items():
+        if any(keyword in query_lower for keyword in keywords):
+            hits.add(("entity", entity))
+    for context, keywords in _CONTEXT_PATTERNS.items():
+        if any(keyword in query_lower for keyword in keywords):
+            hits.add(("context", context))
+    return hits
+
+
 class MemoryManager:
     """
     Manages evolution of extraction pattern memory across DOM chunks.
@@ -50,11 +141,48 @@ class MemoryManager:
         self.llm_client = llm_client
         self.compression_threshold = compression_threshold
         self.confidence_threshold = confidence_threshold
+        self._response_cache = OrderedDict()
+        # Per-chunk discovery cache keyed by content hash: byte-identical
+        # boilerplate chunks (repeated nav/footer fragments) reuse the
+        # parsed discoveries instead of paying another Bedrock call
+        self._chunk_discovery_cache = OrderedDict()
+        self._prefetch_executor = None
+        # Build the keyword automaton at init so the one-time cost lands
+        # here instead of on the first query scan
+        _get_keyword_automaton()
         self.compression_strategy = MemoryCompressionStrategy(
             max_patterns=compression_threshold,
             min_confidence_threshold=confidence_threshold
         )
     
+    def prefetch_chunk(self, chunk: DOMChunk) -> None:
+        """
+        Warm the parse cache for an upcoming chunk in the background.
+
+        The per-chunk LLM call is network-bound; parsing the next
+        chunk's HTML on a worker thread hides that CPU cost under the
+        in-flight request. process_chunk then hits the parse cache.
+
+        Args:
+            chunk: Chunk expected to be processed next
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="chunk-prefetch"
+            )
+        self._prefetch_executor.submit(parse_html_cached, chunk.html_content, _PARSER)
+
+    def close(self) -> None:
+        """
+        Shut down the prefetch worker thread.
+
+        Safe to call multiple times; a later prefetch_chunk call lazily
+        recreates the executor.
+        """
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
     def initialize_memory(self, user_query: str) -> ChunkMemoryInput:
         """
         Create initial memory state from user intent.
@@ -92,7 +220,7 @@ class MemoryManager:
                 total_chunks=1  # Will be updated when chunks are available
             )
             
-            logger.info(f"Initialized memory for query: {user_query[:100]}...")
+            logger.info("Initialized memory for query: %.100s...", user_query)
             return initial_memory
             
         except Exception as e:
@@ -122,64 +250,83 @@ class MemoryManager:
             ChunkMemoryOutput: Updated memory with new discoveries
         """
         try:
-            logger.info(f"Processing chunk {chunk.chunk_index}/{chunk.total_chunks}")
+            logger.info("Processing chunk %d/%d", chunk.chunk_index, chunk.total_chunks)
             
-            # Prepare prompt for LLM analysis
-            prompt = render_chunk_analysis_prompt(
-                chunk_index=chunk.chunk_index,
-                total_chunks=chunk.total_chunks,
-                user_intent=current_memory.user_intent.original_query,
-                chunk_start_xpath=current_memory.chunk_start_position.xpath,
-                nesting_context=chunk.context.get_context_html(),
-                previous_chunk_end=current_memory.chunk_start_position.previous_chunk_end,
-                discovered_facts=str(current_memory.discovered_facts),
-                html_chunk=chunk.html_content
-            )
-            
-            # Call LLM for chunk analysis
-            response = self.llm_client.call_claude(
-                prompt=prompt,
-                max_tokens=4000,
-                temperature=0.1
-            )
+            # Byte-identical chunk content yields identical discoveries,
+            # so repeated boilerplate skips the LLM round-trip entirely
+            content_key = hashlib.blake2b(
+                chunk.html_content.encode(), digest_size=16
+            ).digest()
+            cached_discoveries = self._chunk_discovery_cache.get(content_key)
             
-            # Parse JSON response
-            import json
-            try:
-                validated_response = json.loads(response)
-            except json.JSONDecodeError as e:
-                raise MemoryError(f"Failed to parse LLM response as JSON: {e}")
-            
-            # Extract new patterns from response
-            new_patterns = validated_response.get("discovered_patterns", [])
-            pattern_confidences = validated_response.get("confidence_scores", {})
-            understanding = validated_response.get("page_understanding", "")
-            
-            # Validate patterns against actual HTML
-            valid_patterns = self._validate_patterns(new_patterns, chunk.html_content)
+            if cached_discoveries is not None:
+                self._chunk_discovery_cache.move_to_end(content_key)
+                new_patterns, pattern_confidences, understanding = cached_discoveries
+            else:
+                # Prepare prompt for LLM analysis; the static prefix is
+                # shared across chunks and marked for provider-side caching
+                static_prefix, prompt = render_chunk_analysis_prompt(
+                    chunk_index=chunk.chunk_index,
+                    total_chunks=chunk.total_chunks,
+                    user_intent=current_memory.user_intent.original_query,
+                    chunk_start_xpath=current_memory.chunk_start_position.xpath,
+                    nesting_context=chunk.context.get_context_html(),
+                    previous_chunk_end=current_memory.chunk_start_position.previous_chunk_end,
+                    discovered_facts=str(current_memory.discovered_facts),
+                    html_chunk=chunk.html_content
+                )
+                
+                # Call LLM for chunk analysis (cached for repeated chunks)
+                response = self._cached_call(
+                    prompt=prompt,
+                    max_tokens=4000,
+                    temperature=0.1,
+                    static_prefix=static_prefix
+                )
+                
+                # Parse JSON response
+                import json
+                try:
+                    validated_response = json.loads(response)
+                except json.JSONDecodeError as e:
+                    raise MemoryError(f"Failed to parse LLM response as JSON: {e}")
+                
+                # Extract new patterns from response
+                new_patterns = validated_response.get("discovered_patterns", [])
+                pattern_confidences = validated_response.get("confidence_scores", {})
+                understanding = validated_response.get("page_understanding", "")
+                
+                self._chunk_discovery_cache[content_key] = (
+                    new_patterns, pattern_confidences, understanding
+                )
+                if len(self._chunk_discovery_cache) > self.RESPONSE_CACHE_SIZE:
+                    self._chunk_discovery_cache.popitem(last=False)
             
-            # Update discovered facts
-            updated_facts = self._merge_discoveries(
+            # Validate patterns against actual HTML and merge in one pass
+            updated_facts, valid_count = self._validate_and_merge(
                 current_memory.discovered_facts,
-                valid_patterns,
+                new_patterns,
                 pattern_confidences,
-                understanding
+                understanding,
+                chunk.html_content
             )
             
-            # Update DOM position
-            end_position = DOMPosition(
+            # Update DOM position; all values are internally derived, so
+            # model_construct skips re-validation in the per-chunk loop
+            end_position = DOMPosition.model_construct(
                 xpath=f"//html[position()>={chunk.boundary.end_position}]",
                 nesting_context=chunk.context.get_context_html(),
-                previous_chunk_end=chunk.html_content[-200:] if len(chunk.html_content) > 200 else chunk.html_content,
+                # Slicing already returns the whole string when shorter
+                previous_chunk_end=chunk.html_content[-200:],
                 nesting_level=chunk.context.nesting_level
             )
-            
+
             # Create output memory
-            output_memory = ChunkMemoryOutput(
+            output_memory = ChunkMemoryOutput.model_construct(
                 chunk_end_position=end_position,
                 user_intent=current_memory.user_intent,
                 updated_facts=updated_facts,
-                processing_notes=f"Processed chunk {chunk.chunk_index}, found {len(valid_patterns)} new patterns",
+                processing_notes=f"Processed chunk {chunk.chunk_index}, found {valid_count} new patterns",
                 chunk_index=chunk.chunk_index
             )
             
@@ -188,13 +335,175 @@ class MemoryManager:
                 logger.info("Applying memory compression")
                 output_memory.updated_facts = self.compression_strategy.compress_facts(updated_facts)
             
-            print(f"output_memory: {output_memory}")
-
             return output_memory
             
+        except ConfigurationError:
+            # Credential/setup failures must surface as-is so analyze()
+            # can abort instead of degrading to the simplified fallback
+            raise
         except Exception as e:
             raise MemoryError(f"Failed to process chunk {chunk.chunk_index}: {e}")
     
+    def process_chunks_batch(
+        self,
+        chunks: List[DOMChunk],
+        current_memory: ChunkMemoryInput,
+        batch_size: int = 4
+    ) -> ChunkMemoryOutput:
+        """
+        Analyze several chunks per LLM call to amortize request overhead.
+
+        Groups consecutive chunks into one delimited prompt and parses
+        the per-chunk JSON array response, so the network round-trip and
+        static instructions are paid once per batch instead of once per
+        chunk. Memory compression runs between batches rather than
+        between chunks.
+
+        Args:
+            chunks: Ordered chunks to analyze
+            current_memory: Current memory state
+            batch_size: Chunks per LLM call
+
+        Returns:
+            ChunkMemoryOutput: Memory state after the final batch
+        """
+        if not chunks:
+            raise MemoryError("No chunks to process")
+        if batch_size < 1:
+            raise ConfigurationError("Batch size must be at least 1")
+
+        try:
+            output_memory = None
+            for start in range(0, len(chunks), batch_size):
+                batch = chunks[start:start + batch_size]
+                logger.info(
+                    "Processing chunks %d-%d of %d in one call",
+                    batch[0].chunk_index, batch[-1].chunk_index, len(chunks)
+                )
+
+                chunks_block = "\n".join(
+                    f"<chunk {c.chunk_index}>\n{c.html_content}\n</chunk {c.chunk_index}>"
+                    for c in batch
+                )
+                static_prefix, prompt = render_chunk_analysis_batch_prompt(
+                    user_intent=current_memory.user_intent.original_query,
+                    discovered_facts=str(current_memory.discovered_facts),
+                    chunk_count=len(batch),
+                    chunks_block=chunks_block
+                )
+
+                response = self._cached_call(
+                    prompt=prompt,
+                    max_tokens=4000 * len(batch),
+                    temperature=0.1,
+                    static_prefix=static_prefix
+                )
+
+                import json
+                try:
+                    entries = json.loads(response)
+                except json.JSONDecodeError as e:
+                    raise MemoryError(f"Failed to parse batch LLM response as JSON: {e}")
+                if not isinstance(entries, list):
+                    raise MemoryError("Batch LLM response is not a JSON array")
+
+                results_by_index = {
+                    entry.get("chunk_index"): entry
+                    for entry in entries if isinstance(entry, dict)
+                }
+
+                # Merge per chunk so validation runs against the right HTML
+                facts = current_memory.discovered_facts
+                total_valid = 0
+                for chunk in batch:
+                    entry = results_by_index.get(chunk.chunk_index, {})
+                    facts, valid_count = self._validate_and_merge(
+                        facts,
+                        entry.get("discovered_patterns", []),
+                        entry.get("confidence_scores", {}),
+                        entry.get("page_understanding", ""),
+                        chunk.html_content
+                    )
+                    total_valid += valid_count
+
+                last = batch[-1]
+                end_position = DOMPosition.model_construct(
+                    xpath=f"//html[position()>={last.boundary.end_position}]",
+                    nesting_context=last.context.get_context_html(),
+                    previous_chunk_end=last.html_content[-200:],
+                    nesting_level=last.context.nesting_level
+                )
+                output_memory = ChunkMemoryOutput.model_construct(
+                    chunk_end_position=end_position,
+                    user_intent=current_memory.user_intent,
+                    updated_facts=facts,
+                    processing_notes=(
+                        f"Processed chunks {batch[0].chunk_index}-{last.chunk_index} "
+                        f"in batch, found {total_valid} new patterns"
+                    ),
+                    chunk_index=last.chunk_index
+                )
+
+                if start + batch_size < len(chunks):
+                    current_memory = self.compress_memory(output_memory)
+
+            return output_memory
+
+        except (ConfigurationError, MemoryError):
+            raise
+        except Exception as e:
+            raise MemoryError(f"Failed to process chunk batch: {e}")
+
+    # Maximum number of cached LLM responses before LRU eviction
+    RESPONSE_CACHE_SIZE = 1000
+
+    def _cached_call(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        static_prefix: Optional[str] = None
+    ) -> str:
+        """
+        Call Claude with an exact-match response cache.
+
+        Template-heavy pages (paginated listings, repeated blocks) produce
+        identical prompts across chunks; caching by prompt hash turns those
+        repeats into dict lookups instead of full LLM round-trips.
+
+        Args:
+            prompt: Rendered chunk analysis prompt
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+
+        Returns:
+            Response text from Claude (possibly cached)
+        """
+        key = hashlib.blake2b(
+            f"{max_tokens}:{temperature}:{static_prefix}:{prompt}".encode(),
+            digest_size=16
+        ).hexdigest()
+
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            logger.info("LLM response cache hit for chunk prompt")
+            return cached
+
+        response = self.llm_client.call_claude(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            static_prefix=static_prefix
+        )
+        # call_claude returns "" when retries are exhausted; caching that
+        # sentinel would pin the failure for every later identical prompt
+        if response:
+            self._response_cache[key] = response
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
+
     def compress_memory(self, memory: ChunkMemoryOutput) -> ChunkMemoryInput:
         """
         Intelligent memory compression to prevent token overflow.
@@ -216,8 +525,10 @@ class MemoryManager:
             # Apply compression strategy
             compressed_facts = self.compression_strategy.compress_facts(memory.updated_facts)
             
-            # Create new input memory from compressed state
-            compressed_memory = ChunkMemoryInput(
+            # Create new input memory from compressed state; all fields
+            # come from the validated previous output, so trusted
+            # construction avoids re-walking the nested model graph
+            compressed_memory = ChunkMemoryInput.model_construct(
                 chunk_start_position=memory.chunk_end_position,
                 user_intent=memory.user_intent,
                 discovered_facts=compressed_facts,
@@ -225,7 +536,11 @@ class MemoryManager:
                 total_chunks=memory.updated_facts.confidence_scores.get("total_chunks", 1)
             )
             
-            logger.info(f"Compressed memory: {len(memory.updated_facts.structural_patterns)} -> {len(compressed_facts.structural_patterns)} patterns")
+            logger.info(
+                "Compressed memory: %d -> %d patterns",
+                len(memory.updated_facts.structural_patterns),
+                len(compressed_facts.structural_patterns)
+            )
             return compressed_memory
             
         except Exception as e:
@@ -234,116 +549,121 @@ class MemoryManager:
     def _extract_target_entities(self, user_query: str) -> List[str]:
         """Extract target entities from user query."""
         # Simple keyword extraction - could be enhanced with NLP
-        entities = []
-        
-        # Common extraction targets
-        entity_keywords = {
-            "title": ["title", "name", "heading"],
-            "price": ["price", "cost", "amount", "salary"],
-            "description": ["description", "summary", "details"],
-            "link": ["link", "url", "href"],
-            "image": ["image", "photo", "picture"],
-            "date": ["date", "time", "when"],
-            "author": ["author", "by", "creator"],
-            "category": ["category", "type", "genre"],
-            "rating": ["rating", "score", "stars"],
-            "location": ["location", "address", "where"]
-        }
-        
-        query_lower = user_query.lower()
-        for entity, keywords in entity_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                entities.append(entity)
-        
+        hits = _scan_keywords(user_query.lower())
+        entities = [
+            entity for entity in _ENTITY_KEYWORDS
+            if ("entity", entity) in hits
+        ]
+
         # Fallback: assume generic content extraction
         if not entities:
             entities = ["title", "description", "link"]
-        
+
         return entities
-    
+
     def _infer_context(self, user_query: str) -> str:
         """Infer domain context from user query."""
-        context_patterns = {
-            "job listings": ["job", "position", "career", "employment"],
-            "products": ["product", "item", "buy", "shop", "store"],
-            "articles": ["article", "blog", "news", "post"],
-            "events": ["event", "meeting", "conference", "show"],
-            "people": ["people", "person", "profile", "contact"]
-        }
-        
-        query_lower = user_query.lower()
-        for context, keywords in context_patterns.items():
-            if any(keyword in query_lower for keyword in keywords):
+        hits = _scan_keywords(user_query.lower())
+        for context in _CONTEXT_PATTERNS:
+            if ("context", context) in hits:
                 return context
-        
+
         return "general content"
     
-    def _validate_patterns(self, patterns: List[str], html: str) -> List[str]:
-        """Validate discovered patterns against actual HTML using BeautifulSoup."""
-        valid_patterns = []
-        
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            for pattern in patterns:
+    def _validate_and_merge(
+        self,
+        existing: DiscoveredFacts,
+        new_patterns: List[str],
+        pattern_confidences: Dict[str, float],
+        understanding: str,
+        html: str
+    ):
+        """
+        Validate new patterns against chunk HTML and merge survivors.
+
+        Validation and merging used to be separate passes over the same
+        list; fusing them means one loop does the selector check, the EMA
+        confidence update, and the discovery log per pattern.
+
+        Args:
+            existing: Facts accumulated from previous chunks
+            new_patterns: Patterns reported by the LLM for this chunk
+            pattern_confidences: LLM confidence per pattern
+            understanding: Updated page understanding from the LLM
+            html: Chunk HTML to validate patterns against
+
+        Returns:
+            Tuple of (merged DiscoveredFacts, count of valid new patterns)
+        """
+        xpath_tree = None
+        # Content-keyed cache: repeated chunk HTML skips the reparse
+        soup = parse_html_cached(html, _PARSER)
+        if soup is None:
+            logger.warning("Failed to parse chunk for validation")
+            # Fall through with soup=None: patterns merge unvalidated
+
+        merged_confidences = {**existing.confidence_scores}
+        appended_patterns = []
+        new_discoveries = []
+        valid_count = 0
+
+        # Validate highest-confidence patterns first and stop at the
+        # compression threshold: anything beyond it would be evicted by
+        # compress_facts anyway, so the selector checks are wasted work
+        if len(new_patterns) > self.compression_threshold:
+            new_patterns = sorted(
+                new_patterns,
+                key=lambda p: pattern_confidences.get(p, 0.5),
+                reverse=True
+            )
+
+        for pattern in new_patterns:
+            if valid_count >= self.compression_threshold:
+                break
+            if soup is not None:
                 try:
-                    # Test CSS selector
                     if pattern.startswith('/'):
-                        # XPath pattern - skip validation for now
-                        valid_patterns.append(pattern)
+                        # XPath pattern - validate with lxml when available
+                        if _PARSER == 'lxml':
+                            if xpath_tree is None:
+                                from lxml import html as lxml_html
+                                xpath_tree = lxml_html.fromstring(html)
+                            if not compile_xpath(pattern)(xpath_tree):
+                                continue
                     else:
-                        # CSS selector
-                        elements = soup.select(pattern)
-                        if elements:  # Pattern found elements
-                            valid_patterns.append(pattern)
+                        # CSS selector (compiled form cached across chunks)
+                        if not compile_selector(pattern).select(soup):
+                            continue
                 except Exception:
                     # Invalid pattern, skip
                     continue
-                    
-        except Exception as e:
-            logger.warning(f"Failed to validate patterns: {e}")
-            # Return all patterns if validation fails
-            return patterns
-        
-        return valid_patterns
-    
-    def _merge_discoveries(
-        self, 
-        existing: DiscoveredFacts, 
-        new_patterns: List[str],
-        pattern_confidences: Dict[str, float],
-        understanding: str
-    ) -> DiscoveredFacts:
-        """Intelligently merge new patterns with existing knowledge."""
-        
-        # Start with existing facts
-        merged_patterns = existing.structural_patterns.copy()
-        merged_confidences = existing.confidence_scores.copy()
-        
-        # Add new patterns
-        for pattern in new_patterns:
+
+            valid_count += 1
             confidence = pattern_confidences.get(pattern, 0.5)
-            
-            if pattern in merged_confidences:
+            new_discoveries.append(f"{pattern}: {confidence}")
+
+            old_confidence = merged_confidences.get(pattern)
+            if old_confidence is not None:
                 # Update confidence with exponential moving average
-                old_confidence = merged_confidences[pattern]
                 merged_confidences[pattern] = 0.7 * old_confidence + 0.3 * confidence
             else:
                 # New pattern
-                merged_patterns.append(pattern)
+                appended_patterns.append(pattern)
                 merged_confidences[pattern] = confidence
-        
+
         # Update understanding
         updated_understanding = understanding if understanding else existing.page_understanding
-        
-        return DiscoveredFacts(
-            structural_patterns=merged_patterns,
+
+        merged_facts = DiscoveredFacts(
+            structural_patterns=existing.structural_patterns + appended_patterns,
             confidence_scores=merged_confidences,
             page_understanding=updated_understanding,
-            discarded_hypotheses=existing.discarded_hypotheses.copy(),
-            new_discoveries=[f"{p}: {pattern_confidences.get(p, 0.5)}" for p in new_patterns]
+            # Passed through unchanged, so share the list instead of copying
+            discarded_hypotheses=existing.discarded_hypotheses,
+            new_discoveries=new_discoveries
         )
-    
+        return merged_facts, valid_count
+
     def _needs_compression(self, facts: DiscoveredFacts) -> bool:
         """Check if memory compression is needed."""
         return len(facts.structural_patterns) > self.compression_threshold
@@ -1,8 +1,10 @@
 """Final schema generation for converting memory patterns into extraction schemas."""
 
 from typing import Dict, List, Optional
+import functools
+import json
 import logging
-from bs4 import BeautifulSoup
+import types
 
 from ..models.memory import ChunkMemoryOutput
 from ..models.extraction import (
@@ -10,12 +12,89 @@ from ..models.extraction import (
     ItemSelector, FallbackStrategy, SelectorType
 )
 from ..llm import ClaudeClient, render_schema_generation_prompt, validate_json_response
+from ..preprocessing import compile_selector, parse_html_cached
 from ..exceptions import ConfigurationError, SchemaGenerationError
 
 
 logger = logging.getLogger(__name__)
 
 
+# Prefer the C-backed lxml parser for schema validation
+try:
+    import lxml  # noqa: F401
+    _PARSER = 'lxml'
+except ImportError:
+    _PARSER = 'html.parser'
+
+
+# Default selectors, extraction methods, and attribute names for common
+# entities; shared frozen maps so the per-entity helpers allocate nothing
+# Fallback lists are tuples: immutable, so the same object is shared
+# across every schema generation (Pydantic copies into the model field)
+_DEFAULT_SELECTORS = types.MappingProxyType({
+    "title": {
+        "primary": "h1, h2, h3, .title, .heading",
+        "fallbacks": ("title", ".name", ".header")
+    },
+    "price": {
+        "primary": ".price, .cost, .amount",
+        "fallbacks": ("[data-price]", ".value", ".salary")
+    },
+    "description": {
+        "primary": ".description, .summary, p",
+        "fallbacks": (".details", ".content", ".text")
+    },
+    "link": {
+        "primary": "a[href]",
+        "fallbacks": ("[data-url]", "link")
+    },
+    "image": {
+        "primary": "img[src]",
+        "fallbacks": ("[data-image]", ".image")
+    },
+    "date": {
+        "primary": ".date, time",
+        "fallbacks": ("[datetime]", ".timestamp")
+    }
+})
+
+_EXTRACTION_METHODS = types.MappingProxyType({
+    "link": "attribute",
+    "image": "attribute",
+    "url": "attribute",
+    "href": "attribute"
+})
+
+_ATTRIBUTE_NAMES = types.MappingProxyType({
+    "link": "href",
+    "image": "src",
+    "url": "href",
+    "href": "href"
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _entity_defaults(entity: str):
+    """
+    Resolve the default selector, fallbacks, extraction method, and
+    attribute name for an entity once, then reuse the tuple.
+
+    Target entities come from a small fixed vocabulary, so the lookups
+    collapse to a single cached call per entity per process.
+    """
+    selectors = _DEFAULT_SELECTORS.get(entity)
+    if selectors is None:
+        primary, fallbacks = f".{entity}", ()
+    else:
+        primary, fallbacks = selectors["primary"], selectors["fallbacks"]
+    return (
+        primary,
+        fallbacks,
+        _EXTRACTION_METHODS.get(entity, "text"),
+        _ATTRIBUTE_NAMES.get(entity)
+    )
+
+
 class SchemaGenerator:
     """
     Converts final memory state into crawl4ai-compatible extraction schema.
@@ -81,7 +160,11 @@ class SchemaGenerator:
             
             prompt = render_schema_generation_prompt(
                 user_intent=user_query,
-                final_memory=str(memory_data)
+                # Canonical JSON: deterministic key order and compact output
+                # keep the prompt stable across runs and cheaper in tokens
+                final_memory=json.dumps(
+                    memory_data, sort_keys=True, separators=(',', ':'), default=str
+                )
             )
             
             response = self.llm_client.call_claude(
@@ -91,7 +174,6 @@ class SchemaGenerator:
             )
             
             # Parse JSON response
-            import json
             try:
                 validated_response = json.loads(response)
             except json.JSONDecodeError as e:
@@ -137,7 +219,7 @@ class SchemaGenerator:
             # Optimize for crawl4ai compatibility
             optimized_schema = self._optimize_for_crawl4ai(schema)
             
-            logger.info(f"Generated schema with confidence: {schema_confidence:.2f}")
+            logger.info("Generated schema with confidence: %.2f", schema_confidence)
             return optimized_schema
             
         except Exception as e:
@@ -145,10 +227,11 @@ class SchemaGenerator:
     
     def _filter_high_confidence_patterns(self, memory: ChunkMemoryOutput) -> Dict[str, float]:
         """Filter patterns above confidence threshold."""
+        threshold = self.confidence_threshold
         return {
-            pattern: confidence 
+            pattern: confidence
             for pattern, confidence in memory.updated_facts.confidence_scores.items()
-            if confidence >= self.confidence_threshold
+            if confidence >= threshold
         }
     
     def _create_container_selector(
@@ -210,29 +293,23 @@ class SchemaGenerator:
         """Create field selectors for target entities."""
         
         fields = {}
-        
+
         for entity in target_entities:
             entity_config = field_data.get(entity, {})
-            
-            # Default selectors based on entity type
-            default_selectors = self._get_default_selectors(entity)
-            
-            primary_selector = (
-                entity_config.get("selector") or 
-                default_selectors.get("primary") or 
-                f".{entity}"
-            )
-            
+
+            # Defaults resolved once per entity and cached process-wide
+            default_primary, default_fallbacks, method, attr = _entity_defaults(entity)
+
             fields[entity] = FieldSelector(
-                primary_selector=primary_selector,
+                primary_selector=entity_config.get("selector") or default_primary,
                 selector_type=SelectorType.CSS,
                 confidence=entity_config.get("confidence", 0.6),
-                fallback_selectors=entity_config.get("fallbacks", default_selectors.get("fallbacks", [])),
+                fallback_selectors=entity_config.get("fallbacks", default_fallbacks),
                 field_description=entity_config.get("description", f"Extract {entity} information"),
-                extraction_method=self._get_extraction_method(entity),
-                attribute_name=self._get_attribute_name(entity)
+                extraction_method=method,
+                attribute_name=attr
             )
-        
+
         return fields
     
     def _create_fallback_selectors(
@@ -253,10 +330,17 @@ class SchemaGenerator:
             }
             
             if fallback_patterns:
+                # Lowercase each pattern once and pick the overall best up
+                # front instead of redoing both per field
+                lowered_patterns = [(p, p.lower()) for p in fallback_patterns]
+                best_pattern = max(fallback_patterns.keys(), key=lambda k: fallback_patterns[k])
+
                 fallback_fields = {}
                 for field_name in primary_fields.keys():
                     # Find best fallback pattern for this field
-                    field_pattern = self._find_best_fallback_pattern(field_name, fallback_patterns)
+                    field_pattern = self._find_best_fallback_pattern(
+                        field_name, lowered_patterns, best_pattern
+                    )
                     if field_pattern:
                         fallback_fields[field_name] = field_pattern
                 
@@ -274,67 +358,36 @@ class SchemaGenerator:
     
     def _get_default_selectors(self, entity: str) -> Dict[str, any]:
         """Get default selectors for common entities."""
-        defaults = {
-            "title": {
-                "primary": "h1, h2, h3, .title, .heading",
-                "fallbacks": ["title", ".name", ".header"]
-            },
-            "price": {
-                "primary": ".price, .cost, .amount",
-                "fallbacks": ["[data-price]", ".value", ".salary"]
-            },
-            "description": {
-                "primary": ".description, .summary, p",
-                "fallbacks": [".details", ".content", ".text"]
-            },
-            "link": {
-                "primary": "a[href]",
-                "fallbacks": ["[data-url]", "link"]
-            },
-            "image": {
-                "primary": "img[src]",
-                "fallbacks": ["[data-image]", ".image"]
-            },
-            "date": {
-                "primary": ".date, time",
-                "fallbacks": ["[datetime]", ".timestamp"]
-            }
-        }
-        
-        return defaults.get(entity, {"primary": f".{entity}", "fallbacks": []})
-    
+        defaults = _DEFAULT_SELECTORS.get(entity)
+        if defaults is None:
+            # Cold path: unknown entity gets a class-name guess
+            defaults = {"primary": f".{entity}", "fallbacks": ()}
+        return defaults
+
     def _get_extraction_method(self, entity: str) -> str:
         """Get appropriate extraction method for entity type."""
-        method_map = {
-            "link": "attribute",
-            "image": "attribute", 
-            "url": "attribute",
-            "href": "attribute"
-        }
-        return method_map.get(entity, "text")
-    
+        return _EXTRACTION_METHODS.get(entity, "text")
+
     def _get_attribute_name(self, entity: str) -> Optional[str]:
         """Get attribute name for attribute-based extraction."""
-        attr_map = {
-            "link": "href",
-            "image": "src",
-            "url": "href",
-            "href": "href"
-        }
-        return attr_map.get(entity)
+        return _ATTRIBUTE_NAMES.get(entity)
     
-    def _find_best_fallback_pattern(self, field_name: str, patterns: Dict[str, float]) -> Optional[str]:
+    def _find_best_fallback_pattern(
+        self,
+        field_name: str,
+        lowered_patterns: List[tuple],
+        best_pattern: Optional[str]
+    ) -> Optional[str]:
         """Find best fallback pattern for a specific field."""
+        field_lower = field_name.lower()
+
         # Look for patterns that might match the field name
-        for pattern in patterns.keys():
-            if field_name.lower() in pattern.lower():
+        for pattern, pattern_lower in lowered_patterns:
+            if field_lower in pattern_lower:
                 return pattern
-        
+
         # Return highest confidence pattern as fallback
-        if patterns:
-            return max(patterns.keys(), key=lambda k: patterns[k])
-        
-        return None
+        return best_pattern
     
     def _calculate_schema_confidence(
         self, 
@@ -343,21 +396,15 @@ class SchemaGenerator:
         fields: Dict[str, FieldSelector]
     ) -> float:
         """Calculate overall schema confidence."""
-        
-        confidences = [container.confidence, item.confidence]
-        confidences.extend([field.confidence for field in fields.values()])
-        
-        # Weighted average with container and item having higher weight
-        container_weight = 0.3
-        item_weight = 0.3
-        field_weight = 0.4 / len(fields) if fields else 0.4
-        
-        weighted_sum = (
-            container.confidence * container_weight +
-            item.confidence * item_weight +
-            sum(field.confidence * field_weight for field in fields.values())
-        )
-        
+
+        # Weighted average with container and item having higher weight;
+        # the constant field weight factors out of the sum
+        weighted_sum = container.confidence * 0.3 + item.confidence * 0.3
+        if fields:
+            weighted_sum += (0.4 / len(fields)) * sum(
+                field.confidence for field in fields.values()
+            )
+
         return min(1.0, weighted_sum)
     
     def _optimize_for_crawl4ai(self, schema: ExtractionSchema) -> ExtractionSchema:
@@ -368,28 +415,50 @@ class SchemaGenerator:
     def _validate_schema(self, schema: ExtractionSchema, html: str) -> bool:
         """Test schema against source HTML for correctness."""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
+            # Content-keyed cache: re-validating the same source HTML
+            # skips the reparse
+            soup = parse_html_cached(html, _PARSER)
+            if soup is None:
+                logger.warning("Failed to parse source HTML for validation")
+                return False
+
             # Test container selector
-            containers = soup.select(schema.container.selector)
+            containers = compile_selector(schema.container.selector).select(soup)
             if not containers:
-                logger.warning(f"Container selector '{schema.container.selector}' found no elements")
+                logger.warning("Container selector '%s' found no elements", schema.container.selector)
                 return False
-            
+
             # Test item selector within first container
-            items = containers[0].select(schema.item.selector)
+            items = compile_selector(schema.item.selector).select(containers[0])
             if not items:
-                logger.warning(f"Item selector '{schema.item.selector}' found no elements")
+                logger.warning("Item selector '%s' found no elements", schema.item.selector)
                 return False
-            
-            # Test field selectors on first item
-            for field_name, field_selector in schema.fields.items():
-                field_elements = items[0].select(field_selector.primary_selector)
-                if not field_elements:
-                    logger.warning(f"Field selector '{field_selector.primary_selector}' for '{field_name}' found no elements")
-            
+
+            # Test all field selectors in one pass over the first item:
+            # match each descendant against the compiled selectors instead
+            # of re-traversing the subtree once per field
+            pending = {
+                field_name: compile_selector(field_selector.primary_selector)
+                for field_name, field_selector in schema.fields.items()
+            }
+            for element in items[0].descendants:
+                if not pending:
+                    break
+                if element.name is None:
+                    continue
+                matched = [
+                    field_name for field_name, selector in pending.items()
+                    if selector.match(element)
+                ]
+                for field_name in matched:
+                    del pending[field_name]
+
+            for field_name in pending:
+                selector = schema.fields[field_name].primary_selector
+                logger.warning("Field selector '%s' for '%s' found no elements", selector, field_name)
+
             return True
             
         except Exception as e:
-            logger.error(f"Schema validation failed: {e}")
+            logger.error("Schema validation failed: %s", e)
             return False
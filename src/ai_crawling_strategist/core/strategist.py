@@ -1,10 +1,13 @@
 """Main orchestrator for DOM analysis and extraction schema generation."""
 
 from typing import Optional
+import functools
 import logging
+import time
+
 from tqdm import tqdm
 
-from ..auth import CredentialResolver, AWSCredentials
+from ..auth import CredentialResolver, AWSCredentials, get_resolver
 from ..preprocessing import clean_html
 from ..llm import ClaudeClient
 from ..models.extraction import ExtractionSchema
@@ -30,7 +33,11 @@ class DOMStrategist:
     
     Coordinates all modules to provide a simple API for complex DOM processing.
     """
-    
+
+    # Credential sets that already passed the Bedrock probe; repeated
+    # constructions with the same credentials skip the network call
+    _validated_credentials = set()
+
     def __init__(
         self,
         aws_profile: Optional[str] = None,
@@ -39,7 +46,8 @@ class DOMStrategist:
         aws_region: str = "us-east-1",
         chunk_size: int = 2000,
         confidence_threshold: float = 0.8,
-        enable_validation: bool = True
+        enable_validation: bool = True,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize strategist with AWS credentials and processing configuration.
@@ -52,10 +60,11 @@ class DOMStrategist:
             chunk_size: Target tokens per chunk
             confidence_threshold: Minimum confidence for pattern inclusion
             enable_validation: Test credentials on initialization
+            cache_dir: Optional directory for on-disk LLM response caching
         """
         try:
-            # Initialize credential resolver
-            resolver = CredentialResolver()
+            # Shared process-wide credential resolver
+            resolver = get_resolver()
             self.credentials = resolver.resolve(
                 aws_profile=aws_profile,
                 aws_access_key_id=aws_access_key_id,
@@ -70,7 +79,7 @@ class DOMStrategist:
             
             # Initialize components
             self.chunker = DOMChunker(chunk_size=chunk_size)
-            self.llm_client = ClaudeClient(credentials=self.credentials)
+            self.llm_client = ClaudeClient(credentials=self.credentials, cache_dir=cache_dir)
             self.memory_manager = MemoryManager(
                 llm_client=self.llm_client,
                 confidence_threshold=confidence_threshold
@@ -80,9 +89,19 @@ class DOMStrategist:
                 confidence_threshold=confidence_threshold
             )
             
-            # Validate credentials if requested
-            if enable_validation:
-                self._validate_setup()
+            # Credential validation is deferred: the first real Claude
+            # call validates implicitly, saving a dedicated Bedrock
+            # round-trip per construction. Only an offline format sanity
+            # check runs here; bad-but-plausible credentials surface as
+            # ConfigurationError from that first call.
+            if enable_validation and self.credentials not in DOMStrategist._validated_credentials:
+                if not self.credentials.has_plausible_format():
+                    raise ConfigurationError(
+                        "Credential validation failed: AWS credentials have invalid format"
+                    )
+                self._needs_validation = True
+            else:
+                self._needs_validation = False
             
             logger.info("DOMStrategist initialized successfully")
             
@@ -111,6 +130,7 @@ class DOMStrategist:
             ProcessingError: HTML parsing or chunking failures
             LLMError: Claude API failures or validation errors
         """
+        cleaned_html = None
         try:
             logger.info(f"Starting analysis: {len(html_content)} chars, query: {query[:50]}...")
             
@@ -133,23 +153,44 @@ class DOMStrategist:
             
             # Step 4: Process chunks iteratively with progress tracking
             logger.info("Processing chunks with LLM analysis")
+            max_confidence = 0.0
+            last_postfix_update = 0.0
             with tqdm(total=len(chunks), desc="Analyzing chunks") as pbar:
-                for chunk in chunks:
+                for i, chunk in enumerate(chunks):
                     # Update chunk total_chunks if needed
                     chunk.total_chunks = len(chunks)
-                    
+
+                    # Parse the next chunk in the background while this
+                    # chunk's LLM call is in flight
+                    if i + 1 < len(chunks):
+                        self.memory_manager.prefetch_chunk(chunks[i + 1])
+
                     # Process chunk and update memory
                     memory_output = self.memory_manager.process_chunk(chunk, current_memory)
+
+                    # First successful call doubles as credential validation
+                    if self._needs_validation:
+                        DOMStrategist._validated_credentials.add(self.credentials)
+                        self._needs_validation = False
                     
                     # Prepare memory for next chunk (compress if needed)
                     if chunk.chunk_index < len(chunks) - 1:  # Not the last chunk
                         current_memory = self.memory_manager.compress_memory(memory_output)
                     
                     pbar.update(1)
-                    pbar.set_postfix({
-                        'patterns': len(memory_output.updated_facts.structural_patterns),
-                        'confidence': f"{max(memory_output.updated_facts.confidence_scores.values(), default=0):.2f}"
-                    })
+                    # Track the running maximum instead of sweeping all
+                    # scores each iteration, and throttle postfix updates:
+                    # the string formatting is pure display overhead
+                    for score in memory_output.updated_facts.confidence_scores.values():
+                        if score > max_confidence:
+                            max_confidence = score
+                    now = time.monotonic()
+                    if now - last_postfix_update > 0.5 or i == len(chunks) - 1:
+                        last_postfix_update = now
+                        pbar.set_postfix({
+                            'patterns': len(memory_output.updated_facts.structural_patterns),
+                            'confidence': f"{max_confidence:.2f}"
+                        })
             
             final_memory = memory_output
             
@@ -164,12 +205,19 @@ class DOMStrategist:
             logger.info(f"Analysis complete: confidence={schema.schema_confidence:.2f}")
             return schema
             
+        except ConfigurationError:
+            raise
         except ChunkingError as e:
             logger.error(f"Chunking failed: {e}")
-            return self._fallback_analysis(html_content, query)
+            # Reuse the already-cleaned HTML; cleaning is deterministic
+            if cleaned_html is None:
+                cleaned_html = clean_html(html_content)
+            return self._fallback_analysis(cleaned_html, query)
         except MemoryError as e:
             logger.error(f"Memory processing failed: {e}")
-            return self._simplified_analysis(html_content, query)
+            if cleaned_html is None:
+                cleaned_html = clean_html(html_content)
+            return self._simplified_analysis(cleaned_html, query)
         except SchemaGenerationError as e:
             logger.error(f"Schema generation failed: {e}")
             return self._basic_schema_fallback(query)
@@ -178,7 +226,12 @@ class DOMStrategist:
             raise ProcessingError(f"Analysis failed: {e}")
     
     def _validate_setup(self):
-        """Validate AWS credentials and Claude access."""
+        """Explicitly validate AWS credentials with a minimal Claude call.
+
+        Not invoked during construction anymore: the first real call
+        validates implicitly. Kept for callers that want an up-front
+        credential check.
+        """
         try:
             # Test Claude API access with minimal request
             test_response = self.llm_client.call_claude(
@@ -190,20 +243,25 @@ class DOMStrategist:
             if "OK" not in test_response:
                 raise ConfigurationError("Claude API test failed")
             
+            DOMStrategist._validated_credentials.add(self.credentials)
+            self._needs_validation = False
             logger.info("Credentials validated successfully")
             
         except Exception as e:
             raise ConfigurationError(f"Credential validation failed: {e}")
     
-    def _fallback_analysis(self, html_content: str, query: str) -> ExtractionSchema:
-        """Fallback analysis when chunking fails."""
+    @functools.cached_property
+    def _fallback_chunker(self) -> DOMChunker:
+        """Larger-chunk DOMChunker for the fallback path, built on first use."""
+        return DOMChunker(chunk_size=self.chunk_size * 2)
+
+    def _fallback_analysis(self, cleaned_html: str, query: str) -> ExtractionSchema:
+        """Fallback analysis when chunking fails. Expects pre-cleaned HTML."""
         logger.info("Attempting fallback analysis with simplified chunking")
         
         try:
             # Try with simpler chunking strategy
-            simple_chunker = DOMChunker(chunk_size=self.chunk_size * 2)  # Larger chunks
-            cleaned_html = clean_html(html_content)
-            chunks = simple_chunker.chunk_dom(cleaned_html, preserve_context=False)
+            chunks = self._fallback_chunker.chunk_dom(cleaned_html, preserve_context=False)
             
             # Process with simplified approach
             current_memory = self.memory_manager.initialize_memory(query)
@@ -221,34 +279,33 @@ class DOMStrategist:
             
         except Exception as e:
             logger.error(f"Fallback analysis failed: {e}")
-            return self._simplified_analysis(html_content, query)
+            return self._simplified_analysis(cleaned_html, query)
     
-    def _simplified_analysis(self, html_content: str, query: str) -> ExtractionSchema:
-        """Simplified analysis for single chunk processing."""
+    def _simplified_analysis(self, cleaned_html: str, query: str) -> ExtractionSchema:
+        """Simplified analysis for single chunk processing. Expects pre-cleaned HTML."""
         logger.info("Attempting simplified single-chunk analysis")
         
         try:
-            # Clean HTML and treat as single chunk
-            cleaned_html = clean_html(html_content)
-            
+            # Treat the cleaned HTML as a single chunk
             # Truncate if too large
             max_single_chunk = self.chunk_size * 3
             if len(cleaned_html) > max_single_chunk:
                 cleaned_html = cleaned_html[:max_single_chunk]
             
-            # Create single chunk manually
-            from ..models.chunks import DOMChunk, ChunkBoundary, ChunkContext
+            # Create single chunk manually; values are derived locally,
+            # so trusted construction skips the nested validation graph
+            from ..models.chunks import DOMChunk
             
-            chunk = DOMChunk(
+            chunk = DOMChunk.construct_trusted(
                 chunk_id="single_chunk",
                 html_content=cleaned_html,
-                context=ChunkContext(),
-                boundary=ChunkBoundary(
-                    start_position=0,
-                    end_position=len(cleaned_html)
-                ),
+                boundary={
+                    "start_position": 0,
+                    "end_position": len(cleaned_html)
+                },
                 chunk_index=0,
-                total_chunks=1
+                total_chunks=1,
+                metadata={}
             )
             
             # Process single chunk
@@ -268,26 +325,13 @@ class DOMStrategist:
         """Basic schema generation without LLM analysis."""
         logger.info("Generating basic fallback schema")
         
-        from ..models.extraction import (
-            ContainerSelector, ItemSelector, FieldSelector, SelectorType
-        )
-        from ..models.memory import UserIntent
+        from ..models.extraction import FieldSelector
         
         # Extract target entities from query
         target_entities = self.memory_manager._extract_target_entities(query)
         
-        # Create basic selectors
-        container = ContainerSelector(
-            selector="body",
-            confidence=0.3,
-            description="Fallback container selector"
-        )
-        
-        item = ItemSelector(
-            selector="div, article, section, li",
-            confidence=0.3,
-            description="Fallback item selector"
-        )
+        # Constant fallback selectors, built and validated once
+        container, item = _fallback_base_selectors()
         
         # Create basic field selectors
         fields = {}
@@ -312,3 +356,61 @@ class DOMStrategist:
                 "This schema uses basic selectors and may require manual refinement."
             )
         )
+
+
+@functools.lru_cache(maxsize=1)
+def _fallback_base_selectors():
+    """Shared constant container/item selectors for the fallback schema.
+
+    Built once so repeated fallbacks skip Pydantic validation; callers
+    treat the instances as read-only.
+    """
+    from ..models.extraction import ContainerSelector, ItemSelector
+
+    container = ContainerSelector(
+        selector="body",
+        confidence=0.3,
+        description="Fallback container selector"
+    )
+    item = ItemSelector(
+        selector="div, article, section, li",
+        confidence=0.3,
+        description="Fallback item selector"
+    )
+    return container, item
+
+
+@functools.lru_cache(maxsize=8)
+def get_strategist(
+    aws_profile: Optional[str] = None,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    aws_region: str = "us-east-1",
+    chunk_size: int = 2000,
+    confidence_threshold: float = 0.8,
+    enable_validation: bool = True,
+    cache_dir: Optional[str] = None
+) -> DOMStrategist:
+    """
+    Return a shared DOMStrategist for the given configuration.
+
+    Per-request callers (web handlers, CLIs invoked in a loop) pay
+    component setup and the credential probe once per distinct
+    configuration instead of on every construction.
+
+    Args:
+        Same as DOMStrategist.__init__
+
+    Returns:
+        Cached DOMStrategist instance
+    """
+    return DOMStrategist(
+        aws_profile=aws_profile,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        aws_region=aws_region,
+        chunk_size=chunk_size,
+        confidence_threshold=confidence_threshold,
+        enable_validation=enable_validation,
+        cache_dir=cache_dir
+    )
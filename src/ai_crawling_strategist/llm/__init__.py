@@ -6,10 +6,12 @@ and YAML-based prompt template management.
 """
 
 from .claude_client import ClaudeClient
+from .cache import LLMCache
 from .prompt_templates import (
     PromptTemplateLoader,
     get_template_loader,
     render_chunk_analysis_prompt,
+    render_chunk_analysis_batch_prompt,
     render_schema_generation_prompt
 )
 from .response_validator import (
@@ -21,11 +23,13 @@ from .response_validator import (
 __all__ = [
     # Core client
     "ClaudeClient",
+    "LLMCache",
     
     # Template management
     "PromptTemplateLoader",
     "get_template_loader",
     "render_chunk_analysis_prompt", 
+    "render_chunk_analysis_batch_prompt",
     "render_schema_generation_prompt",
     
     # Response validation
@@ -0,0 +1,94 @@
+"""On-disk response cache for deterministic Claude invocations."""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+def _cache_key(
+    model_id: str,
+    temperature: float,
+    top_p: float,
+    max_tokens: int,
+    prompt: str
+) -> str:
+    """
+    Build a collision-safe cache key for an invocation.
+
+    Each field is length-prefixed before hashing so distinct field
+    combinations can never concatenate to the same byte stream.
+    """
+    hasher = hashlib.sha256()
+    for part in (model_id, str(temperature), str(top_p), str(max_tokens), prompt):
+        encoded = part.encode()
+        hasher.update(len(encoded).to_bytes(8, "big"))
+        hasher.update(encoded)
+    return hasher.hexdigest()
+
+
+class LLMCache:
+    """
+    Content-addressable on-disk cache for LLM responses.
+
+    Entries are plain JSON files named by request hash, so cached
+    responses survive process restarts and are shared across runs.
+    Intended for deterministic (temperature=0) invocations where a
+    repeated prompt is guaranteed the same answer.
+    """
+
+    def __init__(self, cache_dir: str, ttl_days: float = 7):
+        """
+        Initialize cache rooted at the given directory.
+
+        Args:
+            cache_dir: Directory for cache entries (created if missing)
+            ttl_days: Entry lifetime in days; stale entries are ignored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+
+    def get(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Request hash from _cache_key
+
+        Returns:
+            Tuple of (response_text, usage_dict) or None on miss
+        """
+        path = self.cache_dir / f"{key}.json"
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if time.time() - entry.get("cached_at", 0) > self.ttl_seconds:
+            return None
+        if "response_text" not in entry or "usage" not in entry:
+            return None
+
+        return entry["response_text"], entry["usage"]
+
+    def set(self, key: str, response_text: str, usage: Dict[str, Any]) -> None:
+        """
+        Store a response; failures are swallowed (cache is best-effort).
+
+        Args:
+            key: Request hash from _cache_key
+            response_text: Model response text
+            usage: Token usage dict for the original call
+        """
+        entry = {
+            "cached_at": time.time(),
+            "response_text": response_text,
+            "usage": usage
+        }
+        try:
+            path = self.cache_dir / f"{key}.json"
+            path.write_text(json.dumps(entry), encoding="utf-8")
+        except OSError:
+            pass
@@ -1,9 +1,44 @@
+import asyncio
 import json
+import logging
 import time
-import boto3
+
+# orjson parses large JSON payloads a few times faster than stdlib json;
+# fall back transparently when it is not installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
 from typing import Tuple, Dict, Any, Optional
 
+from botocore.exceptions import ClientError
+
 from ..auth import AWSCredentials
+from ..auth.credentials import _make_bedrock_client
+from ..exceptions import ConfigurationError
+from .cache import LLMCache, _cache_key
+
+logger = logging.getLogger(__name__)
+
+
+# Bedrock error codes worth retrying with backoff
+_THROTTLE_ERROR_CODES = frozenset({
+    "ThrottlingException",
+    "ModelStreamErrorException",
+    "ServiceUnavailableException"
+})
+
+# Error codes that mean the credentials or request are bad, not transient
+_CONFIGURATION_ERROR_CODES = frozenset({
+    "AccessDeniedException",
+    "UnrecognizedClientException",
+    "ExpiredTokenException",
+    "InvalidSignatureException"
+})
 
 
 class ClaudeClient:
@@ -14,7 +49,8 @@ class ClaudeClient:
         credentials: AWSCredentials,
         model_id: str = "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
         max_retries: int = 5,
-        initial_wait_time: int = 30
+        initial_wait_time: int = 30,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize Claude client with AWS credentials.
@@ -24,18 +60,22 @@ class ClaudeClient:
             model_id: Claude model identifier
             max_retries: Maximum retry attempts for throttling
             initial_wait_time: Initial wait time in seconds for exponential backoff
+            cache_dir: Optional directory for on-disk caching of
+                deterministic (temperature=0) responses
         """
         self.model_id = model_id
         self.max_retries = max_retries
         self.initial_wait_time = initial_wait_time
+        self.cache = LLMCache(cache_dir) if cache_dir else None
         
-        # Initialize Bedrock client with provided credentials
-        self.client = boto3.client(
-            "bedrock-runtime",
-            aws_access_key_id=credentials.access_key_id,
-            aws_secret_access_key=credentials.secret_access_key,
-            region_name=credentials.region,
-            aws_session_token=credentials.session_token
+        # Shared, pooled Bedrock client: boto3 clients are thread-safe,
+        # and the larger connection pool keeps concurrent invocations
+        # from serializing on HTTP connections
+        self.client = _make_bedrock_client(
+            credentials.access_key_id,
+            credentials.secret_access_key,
+            credentials.region,
+            credentials.session_token
         )
     
     def invoke(
@@ -43,7 +83,8 @@ class ClaudeClient:
         prompt: str,
         max_tokens: int = 80000,
         temperature: float = 1.0,
-        top_p: float = 0.999
+        top_p: float = 0.999,
+        static_prefix: Optional[str] = None
     ) -> Tuple[Optional[str], Dict[str, Any]]:
         """
         Invoke Claude with retry logic for throttling errors.
@@ -53,12 +94,30 @@ class ClaudeClient:
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature
             top_p: Top-p sampling parameter
+            static_prefix: Optional instruction prefix shared across calls,
+                sent as a separate content block marked for provider-side
+                prompt caching
             
         Returns:
             Tuple of (response_text, token_usage_dict)
             token_usage_dict contains: input_tokens, output_tokens, total_tokens, estimated_cost
         """
-        request_body = self._build_request(prompt, max_tokens, temperature, top_p)
+        # Only deterministic calls are cacheable: at temperature 0 a
+        # repeated prompt is guaranteed the same answer
+        cache_key = None
+        if self.cache is not None and temperature == 0:
+            cache_key = _cache_key(
+                self.model_id, temperature, top_p, max_tokens,
+                (static_prefix or "") + prompt
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                response_text, usage_info = cached
+                return response_text, {**usage_info, "estimated_cost": 0.0}
+
+        request_body = self._build_request(prompt, max_tokens, temperature, top_p, static_prefix)
+        # The request is identical across retries; serialize it once
+        body_bytes = json.dumps(request_body).encode("utf-8")
         
         retries = 0
         wait_time = self.initial_wait_time
@@ -67,40 +126,165 @@ class ClaudeClient:
             try:
                 response = self.client.invoke_model(
                     modelId=self.model_id,
-                    body=json.dumps(request_body)
+                    body=body_bytes
                 )
-                model_response = json.loads(response["body"].read())
+                model_response = _json_loads(response["body"].read())
                 
                 # Extract response text and calculate usage
                 response_text = model_response["content"][0]["text"]
                 usage_info = self._calculate_usage(model_response.get("usage", {}))
                 
+                if cache_key is not None and response_text is not None:
+                    self.cache.set(cache_key, response_text, usage_info)
+
                 return response_text, usage_info
                 
-            except Exception as e:
-                error_message = str(e)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                
+                # Credential problems will never succeed on retry; surface
+                # them so setup errors are not mistaken for model failures
+                if error_code in _CONFIGURATION_ERROR_CODES:
+                    raise ConfigurationError(
+                        f"Bedrock rejected the request ({error_code}): {e}"
+                    )
                 
                 # Handle throttling errors with exponential backoff
-                if "Model is getting throttled" in error_message:
+                if error_code in _THROTTLE_ERROR_CODES:
                     retries += 1
-                    print(f"WARNING: Model throttled. Retrying in {wait_time}s... (Attempt {retries}/{self.max_retries})")
+                    logger.warning(
+                        "Model throttled (%s). Retrying in %ss... (Attempt %s/%s)",
+                        error_code, wait_time, retries, self.max_retries
+                    )
                     time.sleep(wait_time)
                     wait_time *= 2  # Exponential backoff
                 else:
-                    print(f"ERROR: Failed to invoke Claude model. Reason: {e}")
+                    logger.error("Failed to invoke Claude model (%s). Reason: %s", error_code, e)
                     break
+            except Exception as e:
+                logger.error("Failed to invoke Claude model. Reason: %s", e)
+                break
         
-        print("ERROR: Max retries reached. Failed to invoke the model.")
+        logger.error("Max retries reached. Failed to invoke the model.")
         return None, self._empty_usage()
     
+    def invoke_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 80000,
+        temperature: float = 1.0,
+        top_p: float = 0.999,
+        static_prefix: Optional[str] = None
+    ):
+        """
+        Invoke Claude and yield text deltas as they are generated.
+
+        Uses invoke_model_with_response_stream so callers can start
+        consuming output while the model is still emitting, instead of
+        idling for the full generation before the first byte.
+
+        Args:
+            prompt: Input prompt for the model
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            top_p: Top-p sampling parameter
+            static_prefix: Optional cacheable instruction prefix
+
+        Yields:
+            Text fragments in generation order
+        """
+        request_body = self._build_request(prompt, max_tokens, temperature, top_p, static_prefix)
+
+        response = self.client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=json.dumps(request_body)
+        )
+
+        for event in response["body"]:
+            chunk = _json_loads(event["chunk"]["bytes"])
+            if chunk.get("type") == "content_block_delta":
+                delta = chunk.get("delta", {})
+                if delta.get("type") == "text_delta":
+                    yield delta.get("text", "")
+
+    async def ainvoke(
+        self,
+        prompt: str,
+        max_tokens: int = 80000,
+        temperature: float = 1.0,
+        top_p: float = 0.999,
+        static_prefix: Optional[str] = None
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Async wrapper around invoke for concurrent independent calls.
+
+        Runs the blocking boto3 call on a worker thread so callers can
+        gather several invocations at once; sequential chunk analysis
+        keeps using the sync path because each prompt depends on the
+        previous merge.
+
+        Args:
+            prompt: Input prompt for the model
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            top_p: Top-p sampling parameter
+            static_prefix: Optional cacheable instruction prefix
+
+        Returns:
+            Tuple of (response_text, token_usage_dict)
+        """
+        return await asyncio.to_thread(
+            self.invoke, prompt, max_tokens, temperature, top_p, static_prefix
+        )
+
+    async def acall_claude(
+        self,
+        prompt: str,
+        max_tokens: int = 80000,
+        temperature: float = 1.0,
+        top_p: float = 0.999,
+        static_prefix: Optional[str] = None
+    ) -> str:
+        """
+        Async counterpart of call_claude.
+
+        Args:
+            prompt: Input prompt for the model
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            top_p: Top-p sampling parameter
+            static_prefix: Optional cacheable instruction prefix
+
+        Returns:
+            Response text from Claude
+        """
+        response_text, _ = await self.ainvoke(
+            prompt, max_tokens, temperature, top_p, static_prefix
+        )
+        return response_text or ""
+
     def _build_request(
         self,
         prompt: str,
         max_tokens: int,
         temperature: float,
-        top_p: float
+        top_p: float,
+        static_prefix: Optional[str] = None
     ) -> Dict[str, Any]:
         """Build Anthropic Messages API request format."""
+        content = []
+        if static_prefix:
+            # Identical across calls; cache_control lets Bedrock reuse the
+            # cached prefix instead of re-billing it per request
+            content.append({
+                "type": "text",
+                "text": static_prefix,
+                "cache_control": {"type": "ephemeral"}
+            })
+        content.append({
+            "type": "text",
+            "text": prompt
+        })
         return {
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": max_tokens,
@@ -111,12 +295,7 @@ class ClaudeClient:
             "messages": [
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        }
-                    ]
+                    "content": content
                 }
             ]
         }
@@ -152,7 +331,8 @@ class ClaudeClient:
         prompt: str,
         max_tokens: int = 80000,
         temperature: float = 1.0,
-        top_p: float = 0.999
+        top_p: float = 0.999,
+        static_prefix: Optional[str] = None
     ) -> str:
         """
         Simplified interface for Claude API calls.
@@ -162,9 +342,10 @@ class ClaudeClient:
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature
             top_p: Top-p sampling parameter
+            static_prefix: Optional cacheable instruction prefix
             
         Returns:
             Response text from Claude
         """
-        response_text, _ = self.invoke(prompt, max_tokens, temperature, top_p)
+        response_text, _ = self.invoke(prompt, max_tokens, temperature, top_p, static_prefix)
         return response_text or ""
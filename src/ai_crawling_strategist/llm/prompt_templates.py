@@ -1,8 +1,21 @@
+import pickle
+import string
 import yaml
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Second-level template cache shared across processes: parsed templates
+# are pickled keyed by source mtime, so cold starts skip the YAML parse
+_PICKLE_CACHE_ROOT = Path.home() / ".cache" / "ai_crawling_strategist" / "templates"
+
 
 class PromptTemplateLoader:
     """Loads and manages YAML-based prompt templates."""
@@ -44,13 +57,48 @@ class PromptTemplateLoader:
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_path}")
         
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_data = yaml.safe_load(f)
+        template_data = self._load_pickled(template_name, template_path)
+        if template_data is None:
+            with open(template_path, 'r', encoding='utf-8') as f:
+                template_data = yaml.load(f, Loader=_YamlLoader)
+            
+            # Pre-parse the format string once: rendering then just joins
+            # literal segments and variable values instead of re-parsing the
+            # template on every call
+            template_data["_segments"] = list(
+                string.Formatter().parse(template_data.get("template", ""))
+            )
+            template_data["_required_vars"] = frozenset(template_data.get("variables", []))
+            self._store_pickled(template_name, template_path, template_data)
         
         # Cache for future use
         self._templates_cache[template_name] = template_data
         return template_data
     
+    def _load_pickled(self, template_name: str, template_path: Path) -> Any:
+        """Load the pre-parsed template pickle for the current source mtime."""
+        try:
+            mtime_ns = template_path.stat().st_mtime_ns
+            cache_file = _PICKLE_CACHE_ROOT / f"{template_name}.{mtime_ns}.pkl"
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+    
+    def _store_pickled(self, template_name: str, template_path: Path, template_data: Dict[str, Any]) -> None:
+        """Persist the parsed template keyed by source mtime (best effort)."""
+        try:
+            mtime_ns = template_path.stat().st_mtime_ns
+            _PICKLE_CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+            # Evict pickles for older versions of this template
+            for stale in _PICKLE_CACHE_ROOT.glob(f"{template_name}.*.pkl"):
+                stale.unlink(missing_ok=True)
+            cache_file = _PICKLE_CACHE_ROOT / f"{template_name}.{mtime_ns}.pkl"
+            with open(cache_file, 'wb') as f:
+                pickle.dump(template_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    
     def render_template(self, template_name: str, **variables) -> str:
         """
         Render a template with provided variables.
@@ -66,20 +114,24 @@ class PromptTemplateLoader:
             KeyError: If required variables are missing
         """
         template_data = self.load_template(template_name)
-        template_string = template_data.get("template", "")
         
         # Validate required variables
-        required_vars = template_data.get("variables", [])
-        missing_vars = [var for var in required_vars if var not in variables]
+        missing_vars = template_data["_required_vars"].difference(variables)
         
         if missing_vars:
-            raise KeyError(f"Missing required variables for template '{template_name}': {missing_vars}")
+            raise KeyError(f"Missing required variables for template '{template_name}': {sorted(missing_vars)}")
         
-        # Render template with variables
+        # Render from the pre-parsed segments (templates use plain {var}
+        # fields, so no format-spec handling is needed)
+        parts = []
         try:
-            return template_string.format(**variables)
+            for literal, field, _spec, _conv in template_data["_segments"]:
+                parts.append(literal)
+                if field is not None:
+                    parts.append(str(variables[field]))
         except KeyError as e:
             raise KeyError(f"Template variable not provided: {e}")
+        return "".join(parts)
     
     def list_templates(self) -> List[str]:
         """
@@ -133,6 +185,10 @@ def get_template_loader(templates_dir: str = None) -> PromptTemplateLoader:
     global _template_loader
     if _template_loader is None:
         _template_loader = PromptTemplateLoader(templates_dir)
+        # Preload every template so the file IO and YAML parse happen
+        # here instead of on the first chunk of an analysis
+        for name in _template_loader.list_templates():
+            _template_loader.load_template(name)
     return _template_loader
 
 
@@ -145,7 +201,7 @@ def render_chunk_analysis_prompt(
     previous_chunk_end: str,
     discovered_facts: str,
     html_chunk: str
-) -> str:
+) -> Tuple[str, str]:
     """
     Render chunk analysis prompt template.
     
@@ -160,10 +216,13 @@ def render_chunk_analysis_prompt(
         html_chunk: Current HTML chunk content
         
     Returns:
-        Rendered prompt string
+        Tuple of (static_prefix, rendered_dynamic_prompt); the prefix is
+        identical across chunks so the client can mark it for provider-side
+        prompt caching
     """
     loader = get_template_loader()
-    return loader.render_template(
+    static_prefix = loader.load_template("chunk_analysis").get("static_prefix", "")
+    dynamic_prompt = loader.render_template(
         "chunk_analysis",
         chunk_index=chunk_index,
         total_chunks=total_chunks,
@@ -174,6 +233,37 @@ def render_chunk_analysis_prompt(
         discovered_facts=discovered_facts,
         html_chunk=html_chunk
     )
+    return static_prefix, dynamic_prompt
+
+
+def render_chunk_analysis_batch_prompt(
+    user_intent: str,
+    discovered_facts: str,
+    chunk_count: int,
+    chunks_block: str
+) -> Tuple[str, str]:
+    """
+    Render batched chunk analysis prompt template.
+    
+    Args:
+        user_intent: Original user query/intent
+        discovered_facts: JSON string of current memory state
+        chunk_count: Number of chunks in the batch
+        chunks_block: Pre-rendered <chunk i>...</chunk i> sections
+        
+    Returns:
+        Tuple of (static_prefix, rendered_dynamic_prompt)
+    """
+    loader = get_template_loader()
+    static_prefix = loader.load_template("chunk_analysis_batch").get("static_prefix", "")
+    dynamic_prompt = loader.render_template(
+        "chunk_analysis_batch",
+        user_intent=user_intent,
+        discovered_facts=discovered_facts,
+        chunk_count=chunk_count,
+        chunks_block=chunks_block
+    )
+    return static_prefix, dynamic_prompt
 
 
 def render_schema_generation_prompt(
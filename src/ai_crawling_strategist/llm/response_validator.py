@@ -1,10 +1,35 @@
+import asyncio
+import functools
 import json
-from typing import Dict, Any, Optional, Callable, TypeVar, Type
-from pydantic import BaseModel, ValidationError
+import logging
+import re
+from typing import Awaitable, Dict, Any, List, Optional, Callable, TypeVar, Type
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+# orjson decodes JSON noticeably faster than stdlib json; fall back
+# transparently when it is not installed
+try:
+    from orjson import loads as _json_loads
+    from orjson import JSONDecodeError as _JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+logger = logging.getLogger(__name__)
 
 
 T = TypeVar('T', bound=BaseModel)
 
+# One C-level scan replaces the chain of startswith/endswith slices and
+# also tolerates trailing newlines around the closing fence
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*\n?(.*?)\n?\s*```\s*$', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    """Memoized TypeAdapter per model class for repeated validations."""
+    return TypeAdapter(model_class)
+
 
 class LLMResponseValidator:
     """Validates and retries LLM responses with Pydantic models."""
@@ -20,89 +45,189 @@ class LLMResponseValidator:
     
     def validate_and_retry(
         self,
-        llm_call: Callable[[], str],
+        llm_call: Callable[[Optional[str]], str],
         model_class: Type[T],
-        retry_prompt_modifier: Optional[Callable[[str, str], str]] = None
+        retry_prompt_modifier: Optional[Callable[[Optional[str], list], str]] = None
     ) -> Optional[T]:
         """
         Validate LLM response and retry on validation errors.
         
         Args:
-            llm_call: Function that calls LLM and returns response string
+            llm_call: Function that calls LLM and returns response string;
+                receives the modified prompt on retries (None on the first
+                attempt)
             model_class: Pydantic model class for validation
-            retry_prompt_modifier: Optional function to modify prompt on retry
+            retry_prompt_modifier: Optional function receiving the previous
+                prompt and the compact validation error list, returning a
+                corrected prompt for the next attempt
             
         Returns:
             Validated Pydantic model instance or None if all retries failed
         """
         last_error = None
+        prompt = None
+        # Hoist loop-invariant lookups out of the retry hot path
+        max_retries = self.max_retries
+        clean = self._clean_json_text
+        validate = _get_adapter(model_class).validate_json
         
-        for attempt in range(self.max_retries):
+        for attempt in range(max_retries):
             try:
                 # Get LLM response
-                response_text = llm_call()
+                response_text = llm_call(prompt)
                 
                 if response_text is None:
                     continue
                 
-                # Parse and validate JSON response
-                response_data = self._parse_json_response(response_text)
-                if response_data is None:
+                # Clean and validate in one pass: pydantic-core parses the
+                # JSON straight into the model without a dict intermediate
+                cleaned_text = clean(response_text)
+                if cleaned_text is None:
                     continue
                 
-                # Validate with Pydantic model
-                validated_response = model_class.model_validate(response_data)
-                return validated_response
+                return validate(cleaned_text)
                 
             except ValidationError as e:
-                last_error = f"Validation error: {e}"
-                print(f"WARNING: Validation failed on attempt {attempt + 1}/{self.max_retries}: {e}")
+                # errors() with urls/context off is far cheaper than the
+                # default str(e) rendering and feeds the retry as data
+                errors = e.errors(include_url=False, include_context=False)
+                last_error = errors
+                logger.warning("Validation failed on attempt %d/%d: %s", attempt + 1, max_retries, errors)
                 
-                # If we have a retry modifier and more attempts, modify the prompt
-                if retry_prompt_modifier and attempt < self.max_retries - 1:
-                    # This would require modifying the llm_call to accept error feedback
-                    # For now, just continue with same prompt
-                    pass
+                # Feed the structured errors back so the retry corrects
+                # the actual problem instead of replaying the same prompt
+                if retry_prompt_modifier and attempt < max_retries - 1:
+                    prompt = retry_prompt_modifier(prompt, errors)
                     
             except Exception as e:
                 last_error = f"Unexpected error: {e}"
-                print(f"ERROR: Unexpected error on attempt {attempt + 1}/{self.max_retries}: {e}")
+                logger.error("Unexpected error on attempt %d/%d: %s", attempt + 1, max_retries, e)
         
-        print(f"ERROR: All {self.max_retries} validation attempts failed. Last error: {last_error}")
+        logger.error("All %d validation attempts failed. Last error: %s", max_retries, last_error)
         return None
     
-    def _parse_json_response(self, response_text: str) -> Optional[Dict[str, Any]]:
+    async def avalidate_and_retry(
+        self,
+        llm_call: Callable[[Optional[str]], Awaitable[str]],
+        model_class: Type[T],
+        retry_prompt_modifier: Optional[Callable[[Optional[str], list], str]] = None
+    ) -> Optional[T]:
         """
-        Parse JSON from LLM response, handling common formatting issues.
+        Async counterpart of validate_and_retry for coroutine LLM calls.
+        
+        Args:
+            llm_call: Coroutine function returning the response string;
+                receives the modified prompt on retries (None first)
+            model_class: Pydantic model class for validation
+            retry_prompt_modifier: Optional function receiving the previous
+                prompt and the compact validation error list
+            
+        Returns:
+            Validated Pydantic model instance or None if all retries failed
+        """
+        last_error = None
+        prompt = None
+        max_retries = self.max_retries
+        clean = self._clean_json_text
+        validate = _get_adapter(model_class).validate_json
+        
+        for attempt in range(max_retries):
+            try:
+                response_text = await llm_call(prompt)
+                
+                if response_text is None:
+                    continue
+                
+                cleaned_text = clean(response_text)
+                if cleaned_text is None:
+                    continue
+                
+                return validate(cleaned_text)
+                
+            except ValidationError as e:
+                errors = e.errors(include_url=False, include_context=False)
+                last_error = errors
+                logger.warning("Validation failed on attempt %d/%d: %s", attempt + 1, max_retries, errors)
+                
+                if retry_prompt_modifier and attempt < max_retries - 1:
+                    prompt = retry_prompt_modifier(prompt, errors)
+                    
+            except Exception as e:
+                last_error = f"Unexpected error: {e}"
+                logger.error("Unexpected error on attempt %d/%d: %s", attempt + 1, max_retries, e)
+        
+        logger.error("All %d validation attempts failed. Last error: %s", max_retries, last_error)
+        return None
+    
+    async def validate_many(
+        self,
+        llm_calls: List[Callable[[Optional[str]], Awaitable[str]]],
+        model_class: Type[T],
+        concurrency: int = 10
+    ) -> List[Optional[T]]:
+        """
+        Validate many independent LLM calls concurrently.
+        
+        Overlaps network I/O across calls with a semaphore bounding how
+        many are in flight at once.
+        
+        Args:
+            llm_calls: Coroutine functions, one per prompt
+            model_class: Pydantic model class for validation
+            concurrency: Maximum number of in-flight calls
+            
+        Returns:
+            Validated instances (or None per failed call), in input order
+        """
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def one(call):
+            async with sem:
+                return await self.avalidate_and_retry(call, model_class)
+        
+        return await asyncio.gather(*(one(call) for call in llm_calls))
+    
+    def _clean_json_text(self, response_text: str) -> Optional[str]:
+        """
+        Strip markdown fences and whitespace from an LLM response.
         
         Args:
             response_text: Raw LLM response
             
         Returns:
-            Parsed JSON dict or None if parsing failed
+            Cleaned JSON string ready for parsing, or None if empty
         """
         if not response_text or not response_text.strip():
             return None
         
-        # Clean response text
-        cleaned_text = response_text.strip()
+        # Unwrap a markdown code fence if present, else just strip
+        m = _FENCE_RE.match(response_text)
+        return m.group(1) if m else response_text.strip()
+    
+    def _parse_json_response(self, response_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse JSON from LLM response into a dict.
         
-        # Remove common markdown code block markers
-        if cleaned_text.startswith("```json"):
-            cleaned_text = cleaned_text[7:]
-        if cleaned_text.startswith("```"):
-            cleaned_text = cleaned_text[3:]
-        if cleaned_text.endswith("```"):
-            cleaned_text = cleaned_text[:-3]
+        Legacy path for callers that need the raw dict; validation goes
+        through model_validate_json to avoid the dict intermediate. For
+        large payloads prefer validate_response, which never holds the
+        dict and the model in memory at the same time.
         
-        cleaned_text = cleaned_text.strip()
+        Args:
+            response_text: Raw LLM response
+            
+        Returns:
+            Parsed JSON dict or None if parsing failed
+        """
+        cleaned_text = self._clean_json_text(response_text)
+        if cleaned_text is None:
+            return None
         
         # Try to parse JSON
         try:
-            return json.loads(cleaned_text)
-        except json.JSONDecodeError as e:
-            print(f"WARNING: JSON parsing failed: {e}")
-            print(f"Response text: {cleaned_text[:200]}...")
+            return _json_loads(cleaned_text)
+        except _JSONDecodeError as e:
+            logger.warning("JSON parsing failed: %s; response text: %.200s...", e, cleaned_text)
             return None
     
     def validate_response(
@@ -121,17 +246,19 @@ class LLMResponseValidator:
             Validated model instance or None if validation failed
         """
         try:
-            response_data = self._parse_json_response(response_text)
-            if response_data is None:
+            cleaned_text = self._clean_json_text(response_text)
+            if cleaned_text is None:
                 return None
             
-            return model_class.model_validate(response_data)
+            # pydantic-core raises ValidationError for malformed JSON too,
+            # so one except arm covers both parse and schema failures
+            return _get_adapter(model_class).validate_json(cleaned_text)
             
         except ValidationError as e:
-            print(f"Validation error: {e}")
+            logger.warning("Validation error: %s", e)
             return None
         except Exception as e:
-            print(f"Unexpected validation error: {e}")
+            logger.error("Unexpected validation error: %s", e)
             return None
 
 
@@ -146,8 +273,13 @@ def validate_json_response(response_text: str, model_class: Type[T]) -> Optional
     Returns:
         Validated model instance or None if validation failed
     """
-    validator = LLMResponseValidator()
-    return validator.validate_response(response_text, model_class)
+    return _default_validator().validate_response(response_text, model_class)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_validator() -> LLMResponseValidator:
+    """Shared stateless validator backing validate_json_response."""
+    return LLMResponseValidator()
 
 
 def create_retry_validator(max_retries: int = 3) -> LLMResponseValidator:
@@ -1,9 +1,22 @@
 """DOM chunk data structures for incremental processing."""
 
-from pydantic import BaseModel, Field, validator
+import re
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, field_validator, model_validator
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
+# Compiled once; a C-level scan for any disallowed character beats both
+# per-character set lookups and a full anchored match
+_INVALID_TAG_RE = re.compile(r'[^A-Za-z0-9\-]')
+
+# lxml tokenizes HTML in C and is an order of magnitude faster than the
+# pure-Python html.parser; fall back to BeautifulSoup when unavailable
+try:
+    import lxml.html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
 
 class ChunkingStrategy(str, Enum):
     """Strategy for creating DOM chunks."""
@@ -23,33 +36,61 @@ class ChunkContext(BaseModel):
     nesting_level: int = Field(default=0,ge=0, description="Current nesting depth")
     previous_sibling_info: Optional[str] = Field(default=None, description="Information about previous sibling element")
     
-    @validator('open_parent_tags')
+    # Tag-name occurrence counts mirroring open_parent_tags, so
+    # membership tests in remove_parent_tag are O(1) instead of O(n)
+    _tag_counts: Dict[str, int] = PrivateAttr(default_factory=dict)
+    # Serialized context HTML, rebuilt lazily after stack changes; depth
+    # is stable between sibling chunks, so most calls hit the cache
+    _context_html_cache: Optional[str] = PrivateAttr(default=None)
+    
+    @field_validator('open_parent_tags')
+    @classmethod
     def tags_must_be_valid(cls, v):
         """Ensure all tag names are valid HTML tag names"""
-        valid_chars = set('abcdefghijklmnopqrstuvwxyz0123456789-')
         for tag in v:
-            if not tag or not all(c.lower() in valid_chars for c in tag):
+            if not tag or _INVALID_TAG_RE.search(tag):
                 raise ValueError(f'Invalid tag name: {tag}')
         return v
     
+    @model_validator(mode='after')
+    def _index_tags(self):
+        """Seed the tag-count index from validated open_parent_tags."""
+        counts = {}
+        for tag in self.open_parent_tags:
+            counts[tag] = counts.get(tag, 0) + 1
+        self._tag_counts = counts
+        return self
+    
     def add_parent_tag(self, tag_name: str, attributes: Optional[Dict[str, Any]] = None):
         """Add a parent tag to the context stack."""
         self.open_parent_tags.append(tag_name)
+        self._tag_counts[tag_name] = self._tag_counts.get(tag_name, 0) + 1
+        self._context_html_cache = None
         if attributes:
             self.parent_attributes[tag_name] = attributes
         self.nesting_level += 1
     
     def remove_parent_tag(self, tag_name: str):
         """Remove a parent tag from the context stack."""
-        if tag_name in self.open_parent_tags:
+        count = self._tag_counts.get(tag_name, 0)
+        if count:
             self.open_parent_tags.remove(tag_name)
+            self._context_html_cache = None
+            if count == 1:
+                del self._tag_counts[tag_name]
+            else:
+                self._tag_counts[tag_name] = count - 1
             if tag_name in self.parent_attributes:
                 del self.parent_attributes[tag_name]
             self.nesting_level = max(0, self.nesting_level - 1)
     
     def get_context_html(self) -> str:
         """Generate HTML representation of current context."""
+        if self._context_html_cache is not None:
+            return self._context_html_cache
+        
         if not self.open_parent_tags:
+            self._context_html_cache = ""
             return ""
         
         context_parts = []
@@ -61,24 +102,30 @@ class ChunkContext(BaseModel):
             else:
                 context_parts.append(f"<{tag}>")
         
-        return ''.join(context_parts)
+        result = ''.join(context_parts)
+        self._context_html_cache = result
+        return result
 
 
 class ChunkBoundary(BaseModel):
     """Information about chunk boundaries."""
     
+    # Boundaries never change after chunking; freezing makes sharing
+    # safe and lets pydantic skip per-instance mutation bookkeeping
+    model_config = ConfigDict(frozen=True)
+    
     start_position: int = Field(ge=0, description="Starting character position in original HTML")
     end_position: int = Field(ge=0, description="Ending character position in original HTML")
     start_tag_complete: bool = Field(default=True, description="Whether chunk starts with complete tag")
     end_tag_complete: bool = Field(default=True, description="Whether chunk ends with complete tag")
     boundary_type: str = Field(default="tag_boundary", description="Type of boundary (tag_boundary, forced_split, etc.)")
     
-    @validator('end_position')
-    def end_must_be_after_start(cls, v, values):
+    @model_validator(mode='after')
+    def end_must_be_after_start(self):
         """Ensure end position is after start position"""
-        if 'start_position' in values and v <= values['start_position']:
+        if self.end_position <= self.start_position:
             raise ValueError('End position must be after start position')
-        return v
+        return self
     
     def get_length(self) -> int:
         """Get the length of the chunk in characters."""
@@ -96,28 +143,66 @@ class DOMChunk(BaseModel):
     total_chunks: int = Field(ge=1, description="Total number of chunks in document")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional chunk metadata")
     
-    @validator('chunk_index')
-    def index_must_be_valid(cls, v, values):
+    _text_content: Optional[str] = PrivateAttr(default=None)
+    
+    @model_validator(mode='after')
+    def index_must_be_valid(self):
         """Ensure chunk index is valid relative to total chunks"""
-        if 'total_chunks' in values and v >= values['total_chunks']:
+        if self.chunk_index >= self.total_chunks:
             raise ValueError('Chunk index must be less than total chunks')
-        return v
+        return self
     
-    @validator('html_content')
+    @field_validator('html_content')
+    @classmethod
     def html_must_not_be_empty(cls, v):
         """Ensure HTML content is not empty"""
         if not v.strip():
             raise ValueError('HTML content cannot be empty')
         return v
     
+    @classmethod
+    def construct_trusted(
+        cls,
+        context: "ChunkContext" = None,
+        boundary: "ChunkBoundary" = None,
+        **data
+    ) -> "DOMChunk":
+        """Build a chunk without re-running validation.
+
+        For internal emit paths where content, context and boundary are
+        already derived from validated chunking state; skips the whole
+        pydantic-core validation graph including the nested models.
+        """
+        if isinstance(context, dict):
+            context = ChunkContext.model_construct(**context)
+        if isinstance(boundary, dict):
+            boundary = ChunkBoundary.model_construct(**boundary)
+        return cls.model_construct(
+            context=context if context is not None else ChunkContext(),
+            boundary=boundary,
+            **data
+        )
+    
     def get_text_content(self) -> str:
-        """Extract plain text content from HTML."""
-        from bs4 import BeautifulSoup
+        """Extract plain text content from HTML.
+
+        Memoized per instance; chunk content never changes after
+        construction, so repeated size queries reuse the first parse.
+        """
+        if self._text_content is not None:
+            return self._text_content
         try:
-            soup = BeautifulSoup(self.html_content, 'html.parser')
-            return soup.get_text(strip=True)
+            if _lxml_html is not None:
+                tree = _lxml_html.fromstring(self.html_content)
+                text = ''.join(t.strip() for t in tree.itertext())
+            else:
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(self.html_content, 'html.parser')
+                text = soup.get_text(strip=True)
         except Exception:
-            return ""
+            text = ""
+        self._text_content = text
+        return text
     
     def get_chunk_size(self, unit: str = "characters") -> int:
         """Get chunk size in specified unit."""
@@ -155,26 +240,16 @@ class ChunkingConfig(BaseModel):
     preserve_semantic_blocks: bool = Field(default=False, description="Try to keep semantic elements together")
     overlap_size: int = Field(default=0, ge=0, description="Number of characters to overlap between chunks")
     
-    @validator('max_size')
-    def max_must_be_greater_than_target(cls, v, values):
-        """Ensure max size is greater than target size"""
-        if 'target_size' in values and v <= values['target_size']:
+    @model_validator(mode='after')
+    def sizes_must_be_consistent(self):
+        """Ensure max/min/overlap sizes are consistent with target size"""
+        if self.max_size <= self.target_size:
             raise ValueError('Max size must be greater than target size')
-        return v
-    
-    @validator('min_size')
-    def min_must_be_less_than_target(cls, v, values):
-        """Ensure min size is less than target size"""
-        if 'target_size' in values and v >= values['target_size']:
+        if self.min_size >= self.target_size:
             raise ValueError('Min size must be less than target size')
-        return v
-    
-    @validator('overlap_size')
-    def overlap_must_be_reasonable(cls, v, values):
-        """Ensure overlap size is not too large"""
-        if 'target_size' in values and v >= values['target_size'] // 2:
+        if self.overlap_size >= self.target_size // 2:
             raise ValueError('Overlap size should be less than half of target size')
-        return v
+        return self
     
     def get_size_unit(self) -> str:
         """Get the unit of measurement for chunk sizes."""
@@ -192,15 +267,21 @@ class ChunkingResult(BaseModel):
     chunks: List[DOMChunk] = Field(default_factory=list, description="List of generated chunks")
     config: ChunkingConfig = Field(..., description="Configuration used for chunking")
     original_size: int = Field(ge=0, description="Size of original document")
-    total_chunks: int = Field(ge=0, description="Total number of chunks created")
     chunking_metadata: Dict[str, Any] = Field(default_factory=dict, description="Metadata about chunking process")
     
-    @validator('total_chunks')
-    def total_chunks_must_match_list(cls, v, values):
-        """Ensure total_chunks matches actual chunk count"""
-        if 'chunks' in values and v != len(values['chunks']):
-            raise ValueError('Total chunks must match length of chunks list')
-        return v
+    # Derived instead of stored: cannot drift from the chunk list and
+    # removes a field plus its consistency validator from every build
+    @computed_field
+    @property
+    def total_chunks(self) -> int:
+        """Total number of chunks created."""
+        return len(self.chunks)
+    
+    @classmethod
+    def construct_trusted(cls, **data) -> "ChunkingResult":
+        """Build a result from already-validated chunks without re-validation."""
+        data.pop("total_chunks", None)  # Derived from chunks now
+        return cls.model_construct(**data)
     
     def get_average_chunk_size(self) -> float:
         """Get average chunk size across all chunks."""
@@ -212,12 +293,17 @@ class ChunkingResult(BaseModel):
     
     def get_size_distribution(self) -> Dict[str, int]:
         """Get distribution of chunk sizes."""
+        # One sizes pass feeds all four stats instead of re-walking the
+        # chunk list per aggregate
         sizes = [chunk.get_chunk_size() for chunk in self.chunks]
+        if not sizes:
+            return {'min_size': 0, 'max_size': 0, 'avg_size': 0, 'total_size': 0}
+        total = sum(sizes)
         return {
-            'min_size': min(sizes) if sizes else 0,
-            'max_size': max(sizes) if sizes else 0,
-            'avg_size': int(self.get_average_chunk_size()),
-            'total_size': sum(sizes)
+            'min_size': min(sizes),
+            'max_size': max(sizes),
+            'avg_size': int(total / len(sizes)),
+            'total_size': total
         }
     
     def validate_chunk_integrity(self) -> List[str]:
@@ -1,6 +1,8 @@
 """Final extraction schema models for output generation."""
 
-from pydantic import BaseModel, Field, validator
+from collections import Counter
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 
@@ -16,6 +18,10 @@ class SelectorType(str, Enum):
 class FieldSelector(BaseModel):
     """CSS/XPath selectors with confidence scores."""
     
+    # Selector value-objects are read-only once generated; frozen
+    # instances can be shared across schemas without defensive copies
+    model_config = ConfigDict(frozen=True)
+    
     primary_selector: str = Field(..., description="Main selector for extracting field")
     selector_type: SelectorType = Field(default=SelectorType.CSS, description="Type of selector")
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence score for this selector")
@@ -25,14 +31,18 @@ class FieldSelector(BaseModel):
     attribute_name: Optional[str] = Field(default=None, description="Attribute name if extraction_method is 'attribute'")
     post_processing: List[str] = Field(default_factory=list, description="Post-processing steps (strip, lower, etc.)")
     
-    @validator('primary_selector')
+    _crawl4ai_config: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    @field_validator('primary_selector')
+    @classmethod
     def selector_must_not_be_empty(cls, v):
         """Ensure selector is not empty"""
         if not v.strip():
             raise ValueError('Primary selector cannot be empty')
         return v
     
-    @validator('extraction_method')
+    @field_validator('extraction_method')
+    @classmethod
     def extraction_method_must_be_valid(cls, v):
         """Ensure extraction method is valid"""
         valid_methods = {'text', 'attribute', 'html', 'href', 'src'}
@@ -40,15 +50,23 @@ class FieldSelector(BaseModel):
             raise ValueError(f'Extraction method must be one of: {valid_methods}')
         return v
     
-    @validator('attribute_name')
-    def attribute_required_for_attribute_extraction(cls, v, values):
+    @model_validator(mode='after')
+    def attribute_required_for_attribute_extraction(self):
         """Ensure attribute name is provided when extraction method is 'attribute'"""
-        if values.get('extraction_method') == 'attribute' and not v:
+        if self.extraction_method == 'attribute' and not self.attribute_name:
             raise ValueError('Attribute name is required when extraction method is "attribute"')
-        return v
+        return self
     
     def get_crawl4ai_config(self) -> Dict[str, Any]:
-        """Convert to crawl4ai-compatible field configuration."""
+        """Convert to crawl4ai-compatible field configuration.
+
+        Memoized: the model is frozen, so the config is built once and
+        the shared dict is returned on later calls; treat it as
+        read-only.
+        """
+        if self._crawl4ai_config is not None:
+            return self._crawl4ai_config
+        
         config = {
             'selector': self.primary_selector,
             'type': self.selector_type.value
@@ -62,19 +80,23 @@ class FieldSelector(BaseModel):
         if self.fallback_selectors:
             config['fallback_selectors'] = self.fallback_selectors
         
+        self._crawl4ai_config = config
         return config
 
 
 class ContainerSelector(BaseModel):
     """Selector for the main container holding items to extract."""
     
+    model_config = ConfigDict(frozen=True)
+    
     selector: str = Field(..., description="CSS/XPath selector for container")
     selector_type: SelectorType = Field(default=SelectorType.CSS, description="Type of selector")
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence in container identification")
     description: str = Field(default="", description="Description of what this container represents")
     expected_item_count: Optional[int] = Field(default=None, ge=0, description="Expected number of items in container")
     
-    @validator('selector')
+    @field_validator('selector')
+    @classmethod
     def selector_must_not_be_empty(cls, v):
         """Ensure selector is not empty"""
         if not v.strip():
@@ -85,13 +107,16 @@ class ContainerSelector(BaseModel):
 class ItemSelector(BaseModel):
     """Selector for individual items within the container."""
     
+    model_config = ConfigDict(frozen=True)
+    
     selector: str = Field(..., description="CSS/XPath selector for individual items")
     selector_type: SelectorType = Field(default=SelectorType.CSS, description="Type of selector")
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence in item identification")
     description: str = Field(default="", description="Description of what constitutes an item")
     relative_to_container: bool = Field(default=True, description="Whether selector is relative to container")
     
-    @validator('selector')
+    @field_validator('selector')
+    @classmethod
     def selector_must_not_be_empty(cls, v):
         """Ensure selector is not empty"""
         if not v.strip():
@@ -111,9 +136,11 @@ class FallbackStrategy(BaseModel):
     
     def has_complete_fallback(self, required_fields: List[str]) -> bool:
         """Check if fallback provides all required fields."""
+        # dict.keys() supports set ops, so the completeness check is one
+        # hash-based difference instead of a per-field Python loop
         return (self.container_selector is not None and 
                 self.item_selector is not None and
-                all(field in self.field_selectors for field in required_fields))
+                not (set(required_fields) - self.field_selectors.keys()))
 
 
 class ExtractionSchema(BaseModel):
@@ -127,7 +154,10 @@ class ExtractionSchema(BaseModel):
     extraction_metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata about extraction")
     strategy_explanation: str = Field(..., description="Natural language explanation of the extraction strategy and discovered patterns")
     
-    @validator('fields')
+    _crawl4ai_config: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    @field_validator('fields')
+    @classmethod
     def fields_must_not_be_empty(cls, v):
         """Ensure at least one field is defined"""
         if not v:
@@ -166,7 +196,14 @@ class ExtractionSchema(BaseModel):
         return max(complete_strategies, key=lambda s: s.confidence)
     
     def to_crawl4ai_config(self) -> Dict[str, Any]:
-        """Convert extraction schema to crawl4ai configuration format."""
+        """Convert extraction schema to crawl4ai configuration format.
+
+        Memoized after the first call since schemas are not mutated once
+        generated; callers must treat the returned dict as read-only.
+        """
+        if self._crawl4ai_config is not None:
+            return self._crawl4ai_config
+        
         config = {
             'container_selector': self.container.selector,
             'item_selector': self.item.selector,
@@ -186,17 +223,14 @@ class ExtractionSchema(BaseModel):
                 'fields': best_fallback.field_selectors
             }
         
+        self._crawl4ai_config = config
         return config
     
     def validate_completeness(self, user_requirements: List[str]) -> List[str]:
         """Validate that schema covers all user requirements."""
-        missing_fields = []
-        
-        for requirement in user_requirements:
-            if requirement not in self.fields:
-                missing_fields.append(requirement)
-        
-        return missing_fields
+        missing = set(user_requirements) - self.fields.keys()
+        # Preserve the caller's requirement order in the result
+        return [r for r in user_requirements if r in missing]
 
 
 class ExtractionValidation(BaseModel):
@@ -254,17 +288,14 @@ class ExtractionResult(BaseModel):
         if not self.extracted_data:
             return {}
         
-        field_coverage = {}
         total_items = len(self.extracted_data)
         
-        # Get all possible field names
+        # One pass: count truthy values per field instead of re-scanning
+        # all items for every field
+        filled = Counter()
         all_fields = set()
         for item in self.extracted_data:
             all_fields.update(item.keys())
+            filled.update(k for k, v in item.items() if v)
         
-        # Calculate coverage for each field
-        for field in all_fields:
-            filled_count = sum(1 for item in self.extracted_data if item.get(field))
-            field_coverage[field] = filled_count / total_items
-        
-        return field_coverage
+        return {field: filled[field] / total_items for field in all_fields}
@@ -1,22 +1,30 @@
 """Rolling memory data structures for tracking extraction patterns."""
 
-from pydantic import BaseModel, Field, validator
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, validator
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 
+# defer_build postpones pydantic-core schema construction until a model
+# is first validated, trimming import-time CPU and memory; trusted
+# model_construct paths never pay the build at all.
+
 
 class DOMPosition(BaseModel):
     """Current position tracking in DOM tree."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     xpath: str = Field(..., description="Current XPath location in DOM")
     nesting_context: str = Field(..., description="HTML context of open parent tags")
     previous_chunk_end: str = Field(default="", description="HTML content at end of previous chunk")
     nesting_level: int = Field(ge=0, description="Current depth in DOM tree")
     
-    @validator('xpath')
+    @field_validator('xpath')
+    @classmethod
     def xpath_must_be_valid(cls, v):
         """Ensure xpath starts with // or /"""
-        if not v.startswith(('/', '//')):
+        # // starts with /, so one leading-char check covers both forms
+        if not v or v[0] != '/':
             raise ValueError('XPath must start with / or //')
         return v
 
@@ -24,12 +32,18 @@ class DOMPosition(BaseModel):
 class DiscoveredFacts(BaseModel):
     """Pattern discoveries and confidence scores."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     structural_patterns: List[str] = Field(default_factory=list, description="Discovered CSS/XPath patterns")
     confidence_scores: Dict[str, float] = Field(default_factory=dict, description="Pattern confidence scores (0.0-1.0)")
     page_understanding: str = Field(default="", description="High-level understanding of page structure")
     discarded_hypotheses: List[str] = Field(default_factory=list, description="Patterns that were rejected")
     new_discoveries: List[str] = Field(default_factory=list, description="Patterns found in current chunk")
     
+    # Lazily built set view of structural_patterns; keeps membership
+    # checks O(1) while the list field preserves order and wire format
+    _patterns_set: Optional[Set[str]] = PrivateAttr(default=None)
+    
     @validator('confidence_scores')
     def confidence_must_be_valid_range(cls, v):
         """Ensure all confidence scores are between 0.0 and 1.0"""
@@ -38,25 +52,34 @@ class DiscoveredFacts(BaseModel):
                 raise ValueError(f'Confidence score for {key} must be between 0.0 and 1.0, got {score}')
         return v
     
+    def _pattern_index(self) -> Set[str]:
+        """Set view of structural_patterns, built on first use."""
+        if self._patterns_set is None:
+            self._patterns_set = set(self.structural_patterns)
+        return self._patterns_set
+    
     def add_pattern(self, pattern: str, confidence: float, description: str = ""):
         """Add a new pattern with confidence score."""
         self.structural_patterns.append(pattern)
+        self._pattern_index().add(pattern)
         self.confidence_scores[pattern] = confidence
         if description:
             self.new_discoveries.append(f"{pattern}: {description}")
     
     def discard_pattern(self, pattern: str, reason: str):
         """Mark a pattern as discarded with reason."""
-        if pattern in self.structural_patterns:
+        if pattern in self._pattern_index():
+            self._patterns_set.discard(pattern)
             self.structural_patterns.remove(pattern)
-        if pattern in self.confidence_scores:
-            del self.confidence_scores[pattern]
+        self.confidence_scores.pop(pattern, None)
         self.discarded_hypotheses.append(f"{pattern} ({reason})")
 
 
 class UserIntent(BaseModel):
     """User's extraction intent and requirements."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     original_query: str = Field(..., description="Original natural language query")
     target_entities: List[str] = Field(..., description="List of data fields to extract")
     context: str = Field(default="", description="Context or domain (e.g., 'job listings', 'products')")
@@ -72,6 +95,8 @@ class UserIntent(BaseModel):
 class ChunkMemoryInput(BaseModel):
     """Input memory state for chunk processing."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     chunk_start_position: DOMPosition = Field(..., description="Starting position for current chunk")
     user_intent: UserIntent = Field(..., description="User's extraction requirements")
     discovered_facts: DiscoveredFacts = Field(default_factory=DiscoveredFacts, description="Previously discovered patterns")
@@ -89,6 +114,8 @@ class ChunkMemoryInput(BaseModel):
 class ChunkMemoryOutput(BaseModel):
     """Updated memory state after chunk analysis."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     chunk_end_position: DOMPosition = Field(..., description="Ending position after processing chunk")
     user_intent: UserIntent = Field(..., description="User intent (should remain unchanged)")
     updated_facts: DiscoveredFacts = Field(..., description="Updated pattern discoveries")
@@ -114,6 +141,8 @@ class ChunkMemoryOutput(BaseModel):
 class MemoryCompressionStrategy(BaseModel):
     """Strategy for compressing memory to manage token usage."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     max_patterns: int = Field(default=20, ge=1, description="Maximum number of patterns to keep")
     min_confidence_threshold: float = Field(default=0.5, ge=0.0, le=1.0, description="Minimum confidence to retain pattern")
     prioritize_recent: bool = Field(default=True, description="Whether to prioritize recently discovered patterns")
@@ -144,15 +173,17 @@ class MemoryCompressionStrategy(BaseModel):
         # Keep top patterns up to max_patterns
         kept_patterns = sorted_patterns[:self.max_patterns]
         
-        # Create compressed facts
-        compressed_facts = DiscoveredFacts(
+        # Create compressed facts; every value derives from an already
+        # validated instance, so skip re-running the validators
+        compressed_facts = DiscoveredFacts.model_construct(
             structural_patterns=kept_patterns,
             confidence_scores={p: facts.confidence_scores[p] for p in kept_patterns},
             page_understanding=facts.page_understanding,
             discarded_hypotheses=facts.discarded_hypotheses + [
                 f"Compressed out: {p}" for p in facts.structural_patterns 
                 if p not in kept_patterns
-            ]
+            ],
+            new_discoveries=[]
         )
         
         return compressed_facts
@@ -161,19 +192,52 @@ class MemoryCompressionStrategy(BaseModel):
 class MemoryEvolution(BaseModel):
     """Tracks how memory evolves during processing."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     chunk_memories: List[ChunkMemoryOutput] = Field(default_factory=list, description="Memory state after each chunk")
     compression_events: List[str] = Field(default_factory=list, description="Log of compression events")
     pattern_evolution: Dict[str, List[float]] = Field(default_factory=dict, description="Confidence evolution per pattern")
+    max_retained: int = Field(default=64, ge=1, description="Recent chunk memories kept in full; older ones are compressed")
+    historical_summary: Optional[DiscoveredFacts] = Field(default=None, description="Compressed facts evicted from the retained window")
     
     def add_chunk_memory(self, memory: ChunkMemoryOutput):
         """Add memory state from processed chunk."""
         self.chunk_memories.append(memory)
         
+        # FIFO cap: fold the oldest memory into the compressed summary
+        # so long runs hold a bounded number of full ChunkMemoryOutputs.
+        # pattern_evolution keeps the full history (floats, not trees).
+        if len(self.chunk_memories) > self.max_retained:
+            evicted = self.chunk_memories.pop(0)
+            self._absorb_into_summary(evicted)
+        
         # Track pattern confidence evolution
         for pattern, confidence in memory.updated_facts.confidence_scores.items():
-            if pattern not in self.pattern_evolution:
-                self.pattern_evolution[pattern] = []
-            self.pattern_evolution[pattern].append(confidence)
+            self.pattern_evolution.setdefault(pattern, []).append(confidence)
+    
+    def _absorb_into_summary(self, evicted: ChunkMemoryOutput):
+        """Merge an evicted memory's facts into the compressed summary."""
+        facts = evicted.updated_facts
+        if self.historical_summary is None:
+            merged = facts
+        else:
+            summary = self.historical_summary
+            merged_scores = {**summary.confidence_scores, **facts.confidence_scores}
+            seen = set(summary.structural_patterns)
+            merged = DiscoveredFacts.model_construct(
+                structural_patterns=summary.structural_patterns + [
+                    p for p in facts.structural_patterns if p not in seen
+                ],
+                confidence_scores=merged_scores,
+                page_understanding=facts.page_understanding or summary.page_understanding,
+                discarded_hypotheses=summary.discarded_hypotheses + facts.discarded_hypotheses,
+                new_discoveries=[]
+            )
+        
+        self.historical_summary = MemoryCompressionStrategy().compress_facts(merged)
+        self.compression_events.append(
+            f"Evicted chunk {evicted.chunk_index} memory into historical summary"
+        )
     
     def get_final_memory(self) -> Optional[ChunkMemoryOutput]:
         """Get the final memory state after all chunks."""
@@ -181,11 +245,11 @@ class MemoryEvolution(BaseModel):
     
     def get_stable_patterns(self, min_chunks: int = 3, confidence_threshold: float = 0.8) -> List[str]:
         """Get patterns that remained stable across multiple chunks."""
-        stable_patterns = []
-        
-        for pattern, confidences in self.pattern_evolution.items():
-            if (len(confidences) >= min_chunks and 
-                all(c >= confidence_threshold for c in confidences[-min_chunks:])):
-                stable_patterns.append(pattern)
-        
-        return stable_patterns
+        # min() over the tail slice runs the reduction in C instead of a
+        # per-value generator frame, and short-circuits on any dip anyway
+        return [
+            pattern
+            for pattern, confidences in self.pattern_evolution.items()
+            if len(confidences) >= min_chunks
+            and min(confidences[-min_chunks:]) >= confidence_threshold
+        ]
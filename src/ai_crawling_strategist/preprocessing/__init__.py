@@ -1,22 +1,29 @@
 """HTML preprocessing module for cleaning and filtering content."""
 
-from .html_cleaner import clean_html, get_cleaning_stats
+from .html_cleaner import clean_html, clean_html_streaming, get_cleaning_stats
 from .dom_parser import (
     parse_html,
-    validate_html_structure, 
+    parse_html_cached,
+    validate_html_structure,
     get_dom_stats,
     extract_text_content,
     find_elements_by_pattern,
-    is_likely_content_container
+    is_likely_content_container,
+    compile_selector,
+    compile_xpath
 )
 
 __all__ = [
     'clean_html',
+    'clean_html_streaming',
     'get_cleaning_stats',
     'parse_html',
+    'parse_html_cached',
     'validate_html_structure',
-    'get_dom_stats', 
+    'get_dom_stats',
     'extract_text_content',
     'find_elements_by_pattern',
-    'is_likely_content_container'
+    'is_likely_content_container',
+    'compile_selector',
+    'compile_xpath'
 ]
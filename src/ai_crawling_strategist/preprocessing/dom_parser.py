@@ -1,11 +1,106 @@
 """DOM parsing utilities using BeautifulSoup."""
 
-from bs4 import BeautifulSoup, Tag
-from typing import Optional, List, Dict, Any
+import functools
+import hashlib
 import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 
+import soupsieve
+from bs4 import BeautifulSoup, NavigableString, Tag
 
-def parse_html(html_content: str, parser: str = 'html.parser') -> Optional[BeautifulSoup]:
+# Prefer the C-backed lxml parser; html.parser stays as the lenient
+# fallback inside parse_html
+try:
+    import lxml  # noqa: F401
+    _PARSER = 'lxml'
+except ImportError:
+    _PARSER = 'html.parser'
+
+
+# Parse results keyed by content hash, LRU-bounded. Repeated chunks
+# (pagination, shared templates) and re-validation of the same source
+# HTML skip the parser entirely. The lock keeps lookups and evictions
+# atomic: the prefetch worker populates this cache concurrently with
+# the main thread's reads.
+_SOUP_CACHE_SIZE = 32
+_soup_cache: OrderedDict = OrderedDict()
+_soup_cache_lock = threading.Lock()
+
+
+def parse_html_cached(html_content: str, parser: str = _PARSER) -> Optional[BeautifulSoup]:
+    """
+    Parse HTML through a small content-keyed cache.
+
+    Callers must treat the returned soup as read-only: the same object
+    is handed out for identical content. Mutating callers should use
+    parse_html instead.
+
+    Args:
+        html_content: HTML string to parse
+        parser: BeautifulSoup parser to use ('html.parser', 'lxml', etc.)
+
+    Returns:
+        BeautifulSoup object or None if parsing fails
+    """
+    key = (
+        hashlib.blake2b(html_content.encode(), digest_size=8).digest(),
+        parser
+    )
+    with _soup_cache_lock:
+        soup = _soup_cache.get(key)
+        if soup is not None:
+            _soup_cache.move_to_end(key)
+            return soup
+
+    # Parse outside the lock so a slow parse doesn't stall other threads
+    soup = parse_html(html_content, parser)
+    if soup is not None:
+        with _soup_cache_lock:
+            _soup_cache[key] = soup
+            if len(_soup_cache) > _SOUP_CACHE_SIZE:
+                _soup_cache.popitem(last=False)
+    return soup
+
+
+@functools.lru_cache(maxsize=512)
+def compile_selector(pattern: str):
+    """
+    Compile a CSS selector, caching the parsed form.
+
+    soupsieve re-tokenizes selector strings on every soup.select call;
+    callers that test the same patterns across many chunks should go
+    through this cache and use the compiled selector's .select(soup).
+
+    Args:
+        pattern: CSS selector string
+
+    Returns:
+        Compiled soupsieve selector
+    """
+    return soupsieve.compile(pattern)
+
+
+@functools.lru_cache(maxsize=512)
+def compile_xpath(pattern: str):
+    """
+    Compile an XPath expression with lxml, caching the parsed form.
+
+    Args:
+        pattern: XPath expression string
+
+    Returns:
+        Compiled lxml XPath callable
+
+    Raises:
+        ImportError: If lxml is not installed
+    """
+    from lxml import etree
+    return etree.XPath(pattern)
+
+
+def parse_html(html_content: str, parser: str = _PARSER) -> Optional[BeautifulSoup]:
     """
     Safely parse HTML content with error handling.
     
@@ -30,6 +125,38 @@ def parse_html(html_content: str, parser: str = 'html.parser') -> Optional[Beaut
             return None
 
 
+def _walk_stats(soup: BeautifulSoup) -> Tuple[Counter, int, int]:
+    """
+    Collect tag counts, max nesting depth and text length in one walk.
+
+    Fuses the three separate traversals (find_all, depth recursion,
+    get_text) that validate_html_structure and get_dom_stats used to
+    run over the same tree.
+
+    Args:
+        soup: BeautifulSoup object to analyze
+
+    Returns:
+        Tuple of (tag name Counter, max depth, total stripped text length)
+    """
+    tag_counts = Counter()
+    max_depth = 0
+    text_length = 0
+    
+    stack = [(child, 1) for child in soup.children]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, Tag):
+            tag_counts[node.name] += 1
+            if depth > max_depth:
+                max_depth = depth
+            stack.extend((child, depth + 1) for child in node.children)
+        elif isinstance(node, NavigableString):
+            text_length += len(node.strip())
+    
+    return tag_counts, max_depth, text_length
+
+
 def validate_html_structure(soup: BeautifulSoup) -> Dict[str, Any]:
     """
     Validate that HTML structure is well-formed after processing.
@@ -45,25 +172,22 @@ def validate_html_structure(soup: BeautifulSoup) -> Dict[str, Any]:
     
     errors = []
     
+    tag_counts, max_depth, _ = _walk_stats(soup)
+    tag_count = sum(tag_counts.values())
+    
     # Check for basic structure
-    if not soup.find():
+    if not tag_count:
         errors.append('No HTML tags found')
-    
-    # Check for unclosed tags (BeautifulSoup usually handles this)
-    # This is more of a sanity check
-    all_tags = soup.find_all()
-    if not all_tags:
         errors.append('No tags found after parsing')
     
     # Check for excessive nesting (potential parsing issues)
-    max_depth = _get_max_depth(soup)
     if max_depth > 50:  # Arbitrary threshold
         errors.append(f'Excessive nesting depth: {max_depth}')
     
     return {
         'is_valid': len(errors) == 0,
         'errors': errors,
-        'tag_count': len(all_tags),
+        'tag_count': tag_count,
         'max_depth': max_depth
     }
 
@@ -81,58 +205,98 @@ def get_dom_stats(soup: BeautifulSoup) -> Dict[str, Any]:
     if not soup:
         return {'error': 'Invalid soup object'}
     
-    all_tags = soup.find_all()
-    
-    # Count tag types
-    tag_counts = {}
-    for tag in all_tags:
-        tag_name = tag.name
-        tag_counts[tag_name] = tag_counts.get(tag_name, 0) + 1
-    
-    # Get text content stats
-    text_content = soup.get_text(strip=True)
+    tag_counts, max_depth, text_length = _walk_stats(soup)
     
     return {
-        'total_tags': len(all_tags),
+        'total_tags': sum(tag_counts.values()),
         'unique_tag_types': len(tag_counts),
-        'tag_distribution': tag_counts,
-        'text_length': len(text_content),
-        'max_depth': _get_max_depth(soup)
+        'tag_distribution': dict(tag_counts),
+        'text_length': text_length,
+        'max_depth': max_depth
     }
 
 
+# Whitespace collapser for extract_text_content, compiled once
+_WS_RE = re.compile(r'\s+')
+
+# Block elements that get structural spacing in extract_text_content
+_BLOCK_ELEMENTS = ['div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                   'section', 'article', 'li', 'tr']
+
+
 def extract_text_content(soup: BeautifulSoup, preserve_structure: bool = False) -> str:
     """
     Extract clean text content from HTML.
-    
+
     Args:
         soup: BeautifulSoup object
         preserve_structure: Whether to preserve some structural spacing
-        
+
     Returns:
         Clean text content
     """
     if not soup:
         return ""
-    
+
     if preserve_structure:
-        # Add newlines around block elements
-        block_elements = ['div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 
-                         'section', 'article', 'li', 'tr']
-        
-        for tag_name in block_elements:
-            for tag in soup.find_all(tag_name):
-                if tag.string:
-                    tag.string.replace_with(f"\n{tag.string}\n")
-    
+        # Add newlines around block elements; one traversal covers the
+        # whole block-element list
+        for tag in soup.find_all(_BLOCK_ELEMENTS):
+            if tag.string:
+                tag.string.replace_with(f"\n{tag.string}\n")
+
     text = soup.get_text(separator=' ', strip=True)
-    
+
     # Clean up excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
+    text = _WS_RE.sub(' ', text)
+
     return text.strip()
 
 
+# Characters that make a pattern a real regex rather than a literal
+_REGEX_META = re.compile(r'[\\.+?{}\[\]|()*]')
+
+
+def _pattern_to_selector(pattern: str, attribute: str) -> Optional[str]:
+    """
+    Translate a simple pattern into an attribute CSS selector.
+
+    Plain literals and ^prefix/suffix$ forms map onto [attr*=], [attr^=],
+    [attr$=] and [attr=] selectors, which the selector engine evaluates
+    natively instead of running a Python regex per tag. Returns None for
+    genuine regex patterns, which keep the fallback scan.
+
+    Args:
+        pattern: Pattern supplied to find_elements_by_pattern
+        attribute: Attribute name being matched
+
+    Returns:
+        CSS selector string, or None when the pattern needs a regex
+    """
+    literal = pattern
+    prefix = literal.startswith('^')
+    if prefix:
+        literal = literal[1:]
+    suffix = literal.endswith('$') and not literal.endswith('\\$')
+    if suffix:
+        literal = literal[:-1]
+    
+    if not literal or _REGEX_META.search(literal):
+        return None
+    
+    if prefix and suffix:
+        op = ''
+    elif prefix:
+        op = '^'
+    elif suffix:
+        op = '$'
+    else:
+        op = '*'
+    
+    escaped = literal.replace('\\', '\\\\').replace('"', '\\"')
+    return f'[{attribute}{op}="{escaped}" i]'
+
+
 def find_elements_by_pattern(soup: BeautifulSoup, pattern: str, 
                            attribute: str = 'class') -> List[Tag]:
     """
@@ -149,6 +313,12 @@ def find_elements_by_pattern(soup: BeautifulSoup, pattern: str,
     if not soup:
         return []
     
+    # Hot case: simple literal/prefix/suffix patterns run through the
+    # native selector engine instead of a Python regex per tag
+    selector = _pattern_to_selector(pattern, attribute)
+    if selector is not None:
+        return compile_selector(selector).select(soup)
+    
     matching_tags = []
     regex = re.compile(pattern, re.IGNORECASE)
     
@@ -168,69 +338,61 @@ def find_elements_by_pattern(soup: BeautifulSoup, pattern: str,
 
 def _get_max_depth(element, current_depth: int = 0) -> int:
     """
-    Recursively calculate maximum nesting depth of DOM tree.
-    
+    Calculate maximum nesting depth of DOM tree with an explicit stack.
+
+    Iterative so pathological nesting can't exhaust the interpreter
+    recursion limit, and one stack frame replaces a Python call per node.
+
     Args:
         element: BeautifulSoup element to analyze
-        current_depth: Current depth in recursion
-        
+        current_depth: Depth attributed to the element itself
+
     Returns:
         Maximum depth found
     """
     if not hasattr(element, 'children'):
         return current_depth
-    
-    max_child_depth = current_depth
-    
-    for child in element.children:
-        if hasattr(child, 'name') and child.name:  # Skip text nodes
-            child_depth = _get_max_depth(child, current_depth + 1)
-            max_child_depth = max(max_child_depth, child_depth)
-    
-    return max_child_depth
+
+    max_depth = current_depth
+    stack = [(child, current_depth + 1)
+             for child in element.children if isinstance(child, Tag)]
+
+    while stack:
+        node, depth = stack.pop()
+        if depth > max_depth:
+            max_depth = depth
+        stack.extend((child, depth + 1)
+                     for child in node.children if isinstance(child, Tag))
+
+    return max_depth
+
+
+# Content-bearing tag types for is_likely_content_container
+_CONTENT_TAGS = frozenset({
+    'article', 'section', 'main', 'div', 'p', 'span',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'table', 'tr', 'td', 'th'
+})
 
 
 def is_likely_content_container(tag: Tag) -> bool:
     """
     Heuristic to determine if a tag likely contains content worth extracting.
-    
+
     Args:
         tag: BeautifulSoup Tag object to evaluate
-        
+
     Returns:
         True if tag likely contains extractable content
     """
     if not tag or not hasattr(tag, 'name'):
         return False
-    
-    # Content-bearing tag types
-    content_tags = {
-        'article', 'section', 'main', 'div', 'p', 'span',
-        'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-        'ul', 'ol', 'li', 'table', 'tr', 'td', 'th'
-    }
-    
-    if tag.name not in content_tags:
+
+    if tag.name not in _CONTENT_TAGS:
         return False
-    
-    # Check if tag has meaningful text content
+
+    # Content tags with meaningful text are containers; the old
+    # class/id indicator scan was dead code since it fell through to
+    # True either way
     text = tag.get_text(strip=True)
-    if len(text) < 10:  # Arbitrary minimum content length
-        return False
-    
-    # Check for common content indicators in class/id
-    classes = ' '.join(tag.get('class', []))
-    tag_id = tag.get('id', '')
-    
-    content_indicators = [
-        'content', 'main', 'article', 'post', 'entry',
-        'product', 'item', 'listing', 'card', 'tile'
-    ]
-    
-    combined_attrs = f"{classes} {tag_id}".lower()
-    
-    for indicator in content_indicators:
-        if indicator in combined_attrs:
-            return True
-    
-    return True  # Default to True for content tags with sufficient text
+    return len(text) >= 10  # Arbitrary minimum content length
@@ -1,8 +1,18 @@
 """HTML cleaning and filtering for preprocessing."""
 
-from bs4 import BeautifulSoup, Comment
+import io
+
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
 from typing import Optional
 
+# lxml parses HTML in C and is several times faster than the pure-Python
+# html.parser on large pages; fall back when it is not installed
+try:
+    import lxml  # noqa: F401
+    _PARSER = 'lxml'
+except ImportError:
+    _PARSER = 'html.parser'
+
 
 # Tags that never contain extraction-relevant data
 IRRELEVANT_TAGS = [
@@ -34,6 +44,11 @@ PRESERVE_DATA_ATTRIBUTES = [
     'data-id',
 ]
 
+# Frozen set views for membership checks on the hot cleaning path; the
+# lists above stay as the documented, ordered public form
+_IRRELEVANT_ATTRS = frozenset(IRRELEVANT_ATTRIBUTES)
+_PRESERVE_DATA_ATTRS = frozenset(PRESERVE_DATA_ATTRIBUTES)
+
 
 def clean_html(raw_html: str, preserve_structure: bool = True) -> str:
     """
@@ -49,7 +64,7 @@ def clean_html(raw_html: str, preserve_structure: bool = True) -> str:
     if not raw_html or not raw_html.strip():
         return ""
     
-    soup = BeautifulSoup(raw_html, 'html.parser')
+    soup = BeautifulSoup(raw_html, _PARSER)
     
     # Remove irrelevant tags completely
     _remove_irrelevant_tags(soup)
@@ -67,32 +82,113 @@ def clean_html(raw_html: str, preserve_structure: bool = True) -> str:
     return str(soup)
 
 
+def clean_html_streaming(raw_html: str, preserve_structure: bool = True) -> str:
+    """
+    Clean large HTML pages through lxml's incremental parser.
+
+    Same cleaning rules as clean_html, but irrelevant subtrees are
+    pruned as their closing tags arrive, so a page dominated by script,
+    style or boilerplate never materializes those branches in full.
+    Falls back to clean_html when lxml is not installed.
+
+    Args:
+        raw_html: Raw HTML content to clean
+        preserve_structure: Whether to keep structural tags even if empty
+
+    Returns:
+        Cleaned HTML string with reduced token count
+    """
+    if not raw_html or not raw_html.strip():
+        return ""
+
+    try:
+        from lxml import etree
+        from lxml import html as lxml_html
+    except ImportError:
+        return clean_html(raw_html, preserve_structure)
+
+    irrelevant = frozenset(IRRELEVANT_TAGS)
+    stream = io.BytesIO(raw_html.encode('utf-8'))
+    context = etree.iterparse(stream, events=('end',), html=True, recover=True)
+
+    def drop(elem):
+        # lxml attaches trailing text to the removed element's tail;
+        # reattach it so text after the pruned subtree survives
+        parent = elem.getparent()
+        if parent is None:
+            return
+        if elem.tail:
+            prev = elem.getprevious()
+            if prev is not None:
+                prev.tail = (prev.tail or '') + elem.tail
+            else:
+                parent.text = (parent.text or '') + elem.tail
+        parent.remove(elem)
+
+    root = None
+    for _, elem in context:
+        root = elem
+
+        # Prune irrelevant subtrees the moment they close, releasing
+        # their memory before the rest of the page is parsed
+        if elem.tag in irrelevant:
+            drop(elem)
+            continue
+
+        attrib = elem.attrib
+        if attrib:
+            to_remove = (_IRRELEVANT_ATTRS & set(attrib.keys())) | {
+                attr for attr in attrib
+                if attr.startswith('data-') and attr not in _PRESERVE_DATA_ATTRS
+            }
+            for attr in to_remove:
+                del attrib[attr]
+
+    if root is None:
+        return ""
+    root = root.getroottree().getroot()
+
+    # Comments survive iterparse; strip them in one pass
+    for comment in list(root.iter(etree.Comment)):
+        drop(comment)
+
+    if not preserve_structure:
+        # Bottom-up: iter() yields document order, so the reverse walk
+        # judges children before parents (same shape as _remove_empty_tags)
+        for elem in reversed(list(root.iter())):
+            if (isinstance(elem.tag, str) and
+                elem.tag not in _PRESERVE_IF_EMPTY and
+                len(elem) == 0 and
+                not (elem.text and elem.text.strip())):
+                drop(elem)
+
+    return lxml_html.tostring(root, encoding='unicode')
+
+
 def _remove_irrelevant_tags(soup: BeautifulSoup) -> None:
     """Remove tags that never contain extraction-relevant data."""
-    for tag_name in IRRELEVANT_TAGS:
-        for tag in soup.find_all(tag_name):
-            tag.decompose()
+    # find_all accepts a list of names, so one tree walk covers every
+    # irrelevant tag instead of one walk per name
+    for tag in soup.find_all(IRRELEVANT_TAGS):
+        tag.decompose()
 
 
 def _clean_attributes(soup: BeautifulSoup) -> None:
     """Remove irrelevant attributes while preserving essential ones."""
     for tag in soup.find_all():
-        if not tag.attrs:
+        attrs = tag.attrs
+        if not attrs:
             continue
-            
-        # Get list of attributes to remove
-        attrs_to_remove = []
-        
-        for attr in tag.attrs:
-            if attr in IRRELEVANT_ATTRIBUTES:
-                attrs_to_remove.append(attr)
-            elif attr.startswith('data-') and attr not in PRESERVE_DATA_ATTRIBUTES:
-                # Remove most data-* attributes except whitelisted ones
-                attrs_to_remove.append(attr)
-        
-        # Remove the attributes
-        for attr in attrs_to_remove:
-            del tag.attrs[attr]
+
+        # Blacklist hits via C-level set intersection, plus non-whitelisted
+        # data-* attributes
+        to_remove = (_IRRELEVANT_ATTRS & attrs.keys()) | {
+            attr for attr in attrs
+            if attr.startswith('data-') and attr not in _PRESERVE_DATA_ATTRS
+        }
+
+        for attr in to_remove:
+            del attrs[attr]
 
 
 def _remove_comments(soup: BeautifulSoup) -> None:
@@ -102,21 +198,36 @@ def _remove_comments(soup: BeautifulSoup) -> None:
         comment.extract()
 
 
+# Tags that should be preserved even if empty (structural importance)
+_PRESERVE_IF_EMPTY = frozenset(
+    {'div', 'section', 'article', 'main', 'aside', 'ul', 'ol', 'table'}
+)
+
+
 def _remove_empty_tags(soup: BeautifulSoup) -> None:
     """Remove tags that have no content after cleaning."""
-    # Tags that should be preserved even if empty (structural importance)
-    preserve_if_empty = {'div', 'section', 'article', 'main', 'aside', 'ul', 'ol', 'table'}
-    
-    # Iteratively remove empty tags (may create new empty tags)
-    changed = True
-    while changed:
-        changed = False
-        for tag in soup.find_all():
-            if (tag.name not in preserve_if_empty and 
-                not tag.get_text(strip=True) and 
-                not tag.find_all()):
-                tag.decompose()
-                changed = True
+    # Walk reverse document order so children are judged before their
+    # parents, computing emptiness from the children's already-known
+    # verdicts: a direct-children check per tag instead of a full
+    # get_text subtree walk per tag. A preserved empty tag counts as
+    # content for its ancestors, since it stays in the tree.
+    empty: dict = {}
+    for tag in reversed(soup.find_all()):
+        is_empty = True
+        for child in tag.children:
+            if isinstance(child, Tag):
+                if not empty.get(id(child), False):
+                    is_empty = False
+                    break
+            elif isinstance(child, NavigableString) and child.strip():
+                is_empty = False
+                break
+
+        if is_empty and tag.name not in _PRESERVE_IF_EMPTY:
+            tag.decompose()
+        else:
+            is_empty = False
+        empty[id(tag)] = is_empty
 
 
 def get_cleaning_stats(original_html: str, cleaned_html: str) -> dict: